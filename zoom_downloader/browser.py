@@ -9,15 +9,146 @@ Design note:
 - Keep function wrappers for backward compatibility with existing imports.
 """
 
+import hashlib
+import io
 import json
+import os
+import tempfile
+import threading
 import time
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 STATE_ROOT = PROJECT_ROOT / ".state" / "zoom"
 DEFAULT_USER_DATA_DIR = STATE_ROOT / "userdata"
 DEFAULT_COOKIE_SNAPSHOT_PATH = STATE_ROOT / "cookies.json"
 
+_LAUNCH_ARGS = (
+    "--disable-dev-shm-usage",
+    "--disable-blink-features=AutomationControlled",
+)
+_IGNORE_DEFAULT_ARGS = ("--enable-automation",)
+_USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/120.0.0.0 Safari/537.36"
+)
+
+
+def _dumps(obj) -> bytes:
+    """
+    Variables:
+        • obj
+            usage: storage-state payload serialized for the cookie snapshot file.
+
+    Serializes a payload to compact JSON bytes, using orjson when it is installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _loads(raw: bytes):
+    """
+    Variables:
+        • raw
+            usage: snapshot file bytes parsed back into Python objects.
+
+    Parses JSON bytes, using orjson when it is installed.
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _iter_snapshot_cookies(raw: bytes):
+    """
+    Variables:
+        • raw
+            usage: snapshot file bytes whose cookie records are yielded in order.
+
+    Yields cookie records from a snapshot, streaming them with ijson when it is installed so callers that stop early never parse the origin storage that follows.
+    """
+    if ijson is not None:
+        return ijson.items(io.BytesIO(raw), "cookies.item")
+    return iter(_loads(raw).get("cookies", []))
+
+
+def _digest(payload: bytes) -> bytes:
+    """
+    Variables:
+        • payload
+            usage: serialized storage state fingerprinted to detect unchanged snapshots.
+
+    Returns a short BLAKE2b digest of a serialized snapshot payload.
+    """
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+# Login verdicts keyed by (snapshot path, mtime_ns, size); a rewrite of the
+# snapshot changes the key, so stale entries are never returned.
+_LOGIN_CACHE: dict[tuple[str, int, int], bool] = {}
+
+# Errors that mean "the snapshot is missing or unreadable" rather than a bug.
+_SNAPSHOT_READ_ERRORS: tuple[type[Exception], ...] = (OSError, ValueError, AttributeError)
+if ijson is not None:
+    _SNAPSHOT_READ_ERRORS += (ijson.JSONError,)
+
+# Raw-byte forms of an HTTP-only cookie in compact and indented snapshots; if
+# neither appears, no cookie can qualify and the JSON parse is skipped.
+_HTTP_ONLY_MARKERS = (b'"httpOnly":true', b'"httpOnly": true')
+
+# Playwright only accepts Strict/Lax/None; Chrome exports may use its own
+# spellings, which would otherwise make add_cookies reject the whole batch.
+_SAMESITE_MAP = {
+    "Strict": "Strict",
+    "Lax": "Lax",
+    "None": "None",
+    "strict": "Strict",
+    "lax": "Lax",
+    "no_restriction": "None",
+    "unspecified": "Lax",
+}
+
+# Chromium keeps persistent cookies in this SQLite file (newer builds moved it
+# under Network/). Session cookies are never written there.
+_PROFILE_COOKIE_DB_PATHS = (
+    os.path.join("Default", "Network", "Cookies"),
+    os.path.join("Default", "Cookies"),
+)
+
+
+def _to_playwright_cookie(c: dict) -> dict:
+    """
+    Variables:
+        • c
+            usage: raw cookie record loaded from the snapshot file.
+        • expires
+            usage: cookie expiry copied only when it is a real timestamp rather than a session marker.
+
+    Builds a cookie entry with only the fields Playwright accepts when adding cookies to a context, mapping Chrome-specific sameSite values onto Strict/Lax/None.
+    """
+    return {
+        "name": c["name"],
+        "value": c["value"],
+        "domain": c["domain"],
+        "path": c.get("path", "/"),
+        "secure": c.get("secure", False),
+        "httpOnly": c.get("httpOnly", False),
+        "sameSite": _SAMESITE_MAP.get(c.get("sameSite") or "", "Lax"),
+        **({"expires": expires} if (expires := c.get("expires", -1)) > 0 else {}),
+    }
+
 
 class BrowserSessionManager:
     """
@@ -30,13 +161,46 @@ class BrowserSessionManager:
       usage: JSON file storing all cookies (including session cookies) explicitly.
     - channel
       usage: browser channel name passed to Playwright launch settings.
+    - min_save_interval
+      usage: minimum seconds between snapshot writes; saves inside the window are deferred.
+    - _user_data_dir_str / _cookie_path_str / _cookie_dir_str
+      usage: string forms of the state paths, precomputed for os-level calls on hot paths.
+    - _dirs_created
+      usage: directories already created by this manager, so repeat calls skip the syscall.
+    - _last_hash
+      usage: BLAKE2b digest of the last payload written to disk, used to skip unchanged saves.
+    - _last_save_ts
+      usage: monotonic timestamp of the last snapshot write.
+    - _pending_payload
+      usage: serialized storage state waiting to be written by flush().
+    - _dirty
+      usage: flag set when a deferred payload has not been written yet.
+    - _save_lock
+      usage: re-entrant lock serializing snapshot saves and flushes from concurrent callers.
     """
 
+    __slots__ = (
+        "user_data_dir",
+        "cookie_snapshot_path",
+        "channel",
+        "min_save_interval",
+        "_user_data_dir_str",
+        "_cookie_path_str",
+        "_cookie_dir_str",
+        "_dirs_created",
+        "_last_hash",
+        "_last_save_ts",
+        "_pending_payload",
+        "_dirty",
+        "_save_lock",
+    )
+
     def __init__(
         self,
         user_data_dir: Path | None = None,
         cookie_snapshot_path: Path | None = None,
         channel: str = "chrome",
+        min_save_interval: float = 5.0,
     ):
         """
         Variables:
@@ -46,6 +210,8 @@ class BrowserSessionManager:
                 usage: optional JSON snapshot file path used to explicitly store and reload cookies.
             • channel
                 usage: browser channel label passed to Playwright when launching Chromium.
+            • min_save_interval
+                usage: minimum number of seconds between cookie snapshot writes.
 
         Initializes browser-session storage paths and launch channel settings used by the authentication workflow.
         """
@@ -55,93 +221,252 @@ class BrowserSessionManager:
             if cookie_snapshot_path is not None
             else (self.user_data_dir.parent / DEFAULT_COOKIE_SNAPSHOT_PATH.name)
         )
+        self._user_data_dir_str = os.fspath(self.user_data_dir)
+        self._cookie_path_str = os.fspath(self.cookie_snapshot_path)
+        self._cookie_dir_str = os.path.dirname(self._cookie_path_str)
         self.channel = channel
+        self.min_save_interval = min_save_interval
+        self._dirs_created: set[str] = set()
+        self._last_hash: bytes | None = None
+        self._last_save_ts = float("-inf")
+        self._pending_payload: bytes | None = None
+        self._dirty = False
+        self._save_lock = threading.RLock()
+
+    def _ensure_dir(self, path: str | Path) -> None:
+        """
+        Variables:
+            • path
+                usage: directory that must exist before profile or snapshot files are written.
+            • path_str
+                usage: string form of the directory used as the memoization key and makedirs argument.
+
+        Creates the directory once per manager instance and skips the filesystem call on later invocations.
+        """
+        path_str = os.fspath(path)
+        if path_str in self._dirs_created:
+            return
+        os.makedirs(path_str, exist_ok=True)
+        self._dirs_created.add(path_str)
 
     def is_logged_in(self) -> bool:
         """
         Variables:
-            • data
-                usage: parsed cookie snapshot content loaded from disk for authentication checks.
+            • stat_result
+                usage: snapshot file metadata whose inode, mtime, and size form the login-cache key.
+            • cache_key
+                usage: snapshot identity used to reuse a previous verdict while the file is unchanged.
+            • logged_in
+                usage: authentication verdict computed from the snapshot and stored in the login cache.
+            • raw
+                usage: snapshot file bytes scanned for Zoom and HTTP-only markers before any JSON parsing.
+            • file
+                usage: open snapshot handle read once into raw bytes.
+            • marker
+                usage: iterated HTTP-only byte pattern searched for in the raw snapshot.
             • cookies
-                usage: cookie records read from the snapshot and filtered for Zoom authentication validity.
+                usage: cookie records streamed from the snapshot and filtered for Zoom authentication validity.
             • c
-                usage: iterated cookie record evaluated against Zoom domain and authentication heuristics.
-            • zoom_auth
-                usage: subset of cookies matching Zoom domains and HTTP-only markers to confirm a real login session.
+                usage: iterated cookie record evaluated against Zoom domain and HTTP-only markers, stopping at the first match.
+        Functions:
+            _iter_snapshot_cookies - yields snapshot cookies lazily so the scan can stop at the first match.
 
-        Checks whether a stored cookie snapshot exists and contains authenticated Zoom cookies that indicate a usable login state.
+        Checks whether a stored cookie snapshot exists and contains authenticated Zoom cookies that indicate a usable login state, reusing the cached verdict while the snapshot is unchanged (read failures are never cached) and skipping the JSON parse when a byte scan already rules out a login.
         """
-        if not self.cookie_snapshot_path.exists():
+        try:
+            stat_result = os.stat(self._cookie_path_str)
+        except FileNotFoundError:
             return False
+
+        # The inode changes on every atomic replace, even one that lands within the
+        # same mtime tick with the same size.
+        cache_key = (
+            self._cookie_path_str,
+            stat_result.st_ino,
+            stat_result.st_mtime_ns,
+            stat_result.st_size,
+        )
+        logged_in = _LOGIN_CACHE.get(cache_key)
+        if logged_in is not None:
+            return logged_in
+
         try:
-            data = json.loads(self.cookie_snapshot_path.read_text())
-            cookies = data.get("cookies", [])
-            zoom_auth = [
-                c for c in cookies
-                if "zoom" in c.get("domain", "")
-                and c.get("httpOnly", False)
-            ]
-            return len(zoom_auth) > 0
-        except Exception:
+            with open(self._cookie_path_str, "rb") as file:
+                raw = file.read()
+            if b"zoom" not in raw or not any(marker in raw for marker in _HTTP_ONLY_MARKERS):
+                logged_in = False
+            else:
+                cookies = _iter_snapshot_cookies(raw)
+                logged_in = any(
+                    "zoom" in c.get("domain", "") and c.get("httpOnly", False)
+                    for c in cookies
+                )
+        except _SNAPSHOT_READ_ERRORS:
+            # A failed read may be transient, so it is not remembered as a verdict.
             return False
 
-    def save_cookies(self, context) -> None:
+        _LOGIN_CACHE[cache_key] = logged_in
+        return logged_in
+
+    def save_cookies(self, context, storage: dict | None = None) -> None:
         """
         Variables:
             • context
                 usage: active browser context whose complete storage state is serialized to disk.
             • storage
-                usage: storage-state payload containing cookies and origin data written to the snapshot file.
+                usage: storage-state payload containing cookies and origin data written to the snapshot file; fetched from the context when the caller has not already captured it.
+            • payload
+                usage: serialized storage state compared against the last write and queued for flushing.
+        Functions:
+            _digest - fingerprints the payload so byte-identical state is never rewritten.
+            self.flush - writes the queued payload when the minimum save interval has elapsed.
+
+        Captures the current browser storage state and queues it for the cookie snapshot file, skipping unchanged state and deferring writes that arrive within the minimum save interval.
+        """
+        if storage is None:
+            from playwright.sync_api import Error as PlaywrightError
+
+            try:
+                storage = context.storage_state()
+            except PlaywrightError:
+                # The browser may already be gone (e.g. the user closed the window).
+                return
+
+        payload = _dumps(storage)
+        with self._save_lock:
+            if _digest(payload) == self._last_hash:
+                # The disk already matches the browser; a payload queued since then
+                # is older than this state and must not be flushed over it.
+                self._pending_payload = None
+                self._dirty = False
+                return
+
+            self._pending_payload = payload
+            self._dirty = True
+            if time.monotonic() - self._last_save_ts < self.min_save_interval:
+                return
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Variables:
+            • payload
+                usage: deferred serialized storage state written to the snapshot file.
+            • fd
+                usage: descriptor of the freshly created temporary snapshot file.
+            • tmp_path
+                usage: uniquely named sibling temporary file that receives the payload before being renamed into place.
+            • file
+                usage: open handle used to write and fsync the temporary snapshot.
+        Functions:
+            self._ensure_dir - makes sure the snapshot directory exists before writing.
+
+        Writes any deferred cookie snapshot to disk atomically via a temporary file and rename, so a crash mid-write never leaves a truncated snapshot and concurrent writers never share a temporary file; callers invoke this when a browser context shuts down.
+        """
+        with self._save_lock:
+            if not self._dirty or self._pending_payload is None:
+                return
+
+            payload = self._pending_payload
+            self._ensure_dir(self._cookie_dir_str)
+            tmp_path = None
+            try:
+                fd, tmp_path = tempfile.mkstemp(
+                    dir=self._cookie_dir_str,
+                    prefix=".cookies.",
+                    suffix=".tmp",
+                )
+                with os.fdopen(fd, "wb") as file:
+                    file.write(payload)
+                    file.flush()
+                    os.fsync(file.fileno())
+                os.replace(tmp_path, self._cookie_path_str)
+            except OSError:
+                if tmp_path is not None:
+                    try:
+                        os.unlink(tmp_path)
+                    except OSError:
+                        pass
+                return
+
+            self._last_hash = _digest(payload)
+            self._last_save_ts = time.monotonic()
+            self._pending_payload = None
+            self._dirty = False
+
+    def _profile_has_cookie_store(self) -> bool:
+        """
+        Variables:
+            • relative_path
+                usage: candidate location of Chromium's cookie database inside the profile directory.
+
+        Returns whether the persistent Chromium profile already holds an on-disk cookie database from a previous launch.
+        """
+        return any(
+            os.path.exists(os.path.join(self._user_data_dir_str, relative_path))
+            for relative_path in _PROFILE_COOKIE_DB_PATHS
+        )
+
+    def load_cookies(self) -> list[dict]:
+        """
+        Variables:
+            • file
+                usage: open snapshot handle whose bytes are parsed into cookie records.
+        Functions:
+            self.flush - writes any deferred snapshot first so the newest cookies are returned.
+            _loads - parses the snapshot bytes.
 
-        Captures the current browser storage state and writes it to the cookie snapshot file for later session restoration.
+        Returns the cookie records from the saved snapshot without starting a browser, or an empty list when no readable snapshot exists.
         """
-        self.cookie_snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        if self._dirty:
+            self.flush()
         try:
-            storage = context.storage_state()
-            self.cookie_snapshot_path.write_text(json.dumps(storage, indent=2))
-        except Exception:
-            pass
+            with open(self._cookie_path_str, "rb") as file:
+                return list(_loads(file.read()).get("cookies", []))
+        except _SNAPSHOT_READ_ERRORS:
+            return []
 
-    def restore_cookies(self, context) -> None:
+    def restore_cookies(self, context, session_only: bool = False) -> None:
         """
         Variables:
             • context
                 usage: fresh browser context that receives previously persisted authentication cookies.
+            • session_only
+                usage: flag that limits restoration to session cookies when the profile already reloads persistent ones natively.
             • data
                 usage: parsed cookie snapshot content used to rebuild Playwright-compatible cookie entries.
+            • file
+                usage: open snapshot handle whose bytes are parsed into the cookie data.
             • cookies
                 usage: raw cookie records loaded from snapshot storage.
             • cleaned
                 usage: sanitized cookie entries with only Playwright-supported fields.
             • c
-                usage: individual raw cookie record iterated while constructing sanitized entries.
-            • entry
-                usage: per-cookie structure appended to the restored cookie list.
+                usage: individual raw cookie record converted into a sanitized entry.
+        Functions:
+            _to_playwright_cookie - builds each sanitized cookie entry from a raw snapshot record.
 
-        Rebuilds and injects persisted cookies into a new browser context so authenticated sessions survive browser restarts.
+        Rebuilds and injects persisted cookies into a new browser context so authenticated sessions survive browser restarts, optionally restricted to session cookies.
         """
-        if not self.cookie_snapshot_path.exists():
-            return
         try:
-            data = json.loads(self.cookie_snapshot_path.read_text())
+            with open(self._cookie_path_str, "rb") as file:
+                data = _loads(file.read())
             cookies = data.get("cookies", [])
-            if cookies:
-                cleaned = []
-                for c in cookies:
-                    entry = {
-                        "name": c["name"],
-                        "value": c["value"],
-                        "domain": c["domain"],
-                        "path": c.get("path", "/"),
-                        "secure": c.get("secure", False),
-                        "httpOnly": c.get("httpOnly", False),
-                        "sameSite": c.get("sameSite", "Lax"),
-                    }
-                    if c.get("expires", -1) > 0:
-                        entry["expires"] = c["expires"]
-                    cleaned.append(entry)
-                context.add_cookies(cleaned)
-        except Exception:
+            if session_only:
+                cookies = [c for c in cookies if c.get("expires", -1) <= 0]
+            cleaned = [_to_playwright_cookie(c) for c in cookies]
+        except (*_SNAPSHOT_READ_ERRORS, KeyError):
+            return
+
+        if not cleaned:
+            return
+        from playwright.sync_api import Error as PlaywrightError
+
+        try:
+            context.add_cookies(cleaned)
+        except PlaywrightError:
+            # Playwright rejects the whole batch; a stale snapshot should fall back
+            # to a fresh login rather than abort launch.
             pass
 
     def get_browser_context(self, playwright, headless: bool = False):
@@ -154,41 +479,62 @@ class BrowserSessionManager:
             • context
                 usage: launched persistent browser context used for authenticated Zoom navigation.
         Functions:
+            self._ensure_dir - makes sure the persistent profile directory exists before launch.
+            self._profile_has_cookie_store - detects whether Chromium already reloads persistent cookies from the profile.
             self.restore_cookies - injects persisted cookies into the newly launched browser context.
 
-        Creates a persistent Chromium browser context with project defaults and restores saved cookies before returning it.
+        Creates a persistent Chromium browser context with project defaults and restores saved cookies before returning it, injecting only session cookies when the profile already has its own cookie store.
         """
-        self.user_data_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(self._user_data_dir_str)
         context = playwright.chromium.launch_persistent_context(
-            user_data_dir=str(self.user_data_dir),
+            user_data_dir=self._user_data_dir_str,
             headless=headless,
             channel=self.channel,
-            args=[
-                "--disable-dev-shm-usage",
-                "--disable-blink-features=AutomationControlled",
-            ],
-            ignore_default_args=["--enable-automation"],
-            user_agent=(
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/120.0.0.0 Safari/537.36"
-            ),
+            args=_LAUNCH_ARGS,
+            ignore_default_args=_IGNORE_DEFAULT_ARGS,
+            user_agent=_USER_AGENT,
         )
-        self.restore_cookies(context)
+        self.restore_cookies(context, session_only=self._profile_has_cookie_store())
         return context
 
 
-DEFAULT_BROWSER_SESSION = BrowserSessionManager()
+def _default_browser_session() -> BrowserSessionManager:
+    """
+    Functions:
+        BrowserSessionManager - creates the shared browser-session manager on first use.
+
+    Returns the shared browser-session manager, constructing it the first time it is requested.
+    """
+    global DEFAULT_BROWSER_SESSION
+    if "DEFAULT_BROWSER_SESSION" not in globals():
+        DEFAULT_BROWSER_SESSION = BrowserSessionManager()
+    return DEFAULT_BROWSER_SESSION
+
+
+def __getattr__(name: str):
+    """
+    Variables:
+        • name
+            usage: module attribute requested by an importer that is not yet defined.
+    Functions:
+        _default_browser_session - lazily builds the shared browser-session manager.
+
+    Defers construction of DEFAULT_BROWSER_SESSION until a caller first imports or accesses it.
+    """
+    if name == "DEFAULT_BROWSER_SESSION":
+        return _default_browser_session()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def is_logged_in() -> bool:
     """
     Functions:
+        _default_browser_session - returns the shared browser-session manager, creating it on first use.
         DEFAULT_BROWSER_SESSION.is_logged_in - delegates login-state validation to the shared browser-session manager.
 
     Provides a backward-compatible helper that checks whether authenticated Zoom cookies are currently available.
     """
-    return DEFAULT_BROWSER_SESSION.is_logged_in()
+    return _default_browser_session().is_logged_in()
 
 
 def get_browser_context(playwright, headless: bool = False):
@@ -199,8 +545,9 @@ def get_browser_context(playwright, headless: bool = False):
         • headless
             usage: visibility flag forwarded when creating the browser context.
     Functions:
+        _default_browser_session - returns the shared browser-session manager, creating it on first use.
         DEFAULT_BROWSER_SESSION.get_browser_context - delegates persistent-context creation to the shared browser-session manager.
 
     Provides a backward-compatible helper that creates and returns a configured persistent browser context.
     """
-    return DEFAULT_BROWSER_SESSION.get_browser_context(playwright, headless=headless)
+    return _default_browser_session().get_browser_context(playwright, headless=headless)
@@ -2,22 +2,41 @@
 CLI entrypoints for Zoom recording downloads.
 """
 
+from __future__ import annotations
+
+import atexit
 import re
+import sys
 import warnings
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
+from operator import itemgetter
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
-from playwright.sync_api import sync_playwright
 from rich.console import Console
 from rich.panel import Panel
 
-from zoom_downloader.browser import BrowserSessionManager
-from zoom_downloader.downloader import DownloadService
-from zoom_downloader.scraper import ZoomMediaScraper
-from zoom_downloader.transcript import TranscriptConverter
+# Playwright, requests, and the service modules are imported where they are first
+# needed so `zoom --help` does not pay for loading them.
+if TYPE_CHECKING:
+    import requests
+    from rich.progress import Progress
+
+    from zoom_downloader.browser import BrowserSessionManager
+    from zoom_downloader.downloader import DownloadService
+    from zoom_downloader.scraper import ZoomMediaScraper
+    from zoom_downloader.transcript import TranscriptConverter
 
 warnings.filterwarnings("ignore", message="urllib3 v2 only supports OpenSSL")
 
+_INVALID_FS_CHARS_RE = re.compile(r'[\\/:*?"<>|]+')
+# Playwright's storage_state always includes these keys for every cookie.
+_COOKIE_FIELDS = itemgetter("name", "value", "domain", "path", "secure")
+# Runs speculative filesystem work (creating the default output folder) off the prompt path.
+_BACKGROUND_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="zoom-fs")
+
 
 class ZoomDownloaderCLI:
     """
@@ -34,6 +53,8 @@ class ZoomDownloaderCLI:
       usage: service that extracts media URLs and metadata from Zoom pages.
     - transcript_converter
       usage: converter for VTT transcripts into requested output styles.
+    - _plain_output
+      usage: flag set when output is not a terminal, so panels are printed as plain text.
     """
 
     def __init__(
@@ -59,24 +80,84 @@ class ZoomDownloaderCLI:
         Functions:
             BrowserSessionManager - creates the default browser-session manager when one is not supplied.
             DownloadService - creates the default download service wired to the active console.
+            TextCache - gives the default download service a transcript cache so re-runs skip the fetch.
             ZoomMediaScraper - creates the default scraper wired to the active console.
             TranscriptConverter - creates the default transcript conversion helper.
 
         Initializes the CLI coordinator with either injected collaborators or default service instances for the full download workflow.
         """
+        from zoom_downloader.browser import BrowserSessionManager
+        from zoom_downloader.downloader import DownloadService, TextCache
+        from zoom_downloader.scraper import ZoomMediaScraper
+        from zoom_downloader.transcript import TranscriptConverter
+
+        if console_instance is None and not sys.stdout.isatty():
+            # Piped or logged output: skip colour, highlighting, and width probing.
+            console_instance = Console(no_color=True, highlight=False, emoji=False, width=120)
         self.console = console_instance or Console()
+        self._plain_output = not self.console.is_terminal
         self.browser_session = browser_session or BrowserSessionManager()
-        self.download_service = download_service or DownloadService(console_instance=self.console)
+        if download_service is None:
+            download_service = DownloadService(
+                console_instance=self.console,
+                text_cache=TextCache(),
+            )
+            atexit.register(download_service.close)
+        self.download_service = download_service
         self.media_scraper = media_scraper or ZoomMediaScraper(console_instance=self.console)
         self.transcript_converter = transcript_converter or TranscriptConverter()
 
+    @staticmethod
+    def _build_cookie_jar(storage: dict) -> requests.cookies.RequestsCookieJar:
+        """
+        Variables:
+            • storage
+                usage: browser storage-state snapshot whose cookie list is converted for HTTP requests.
+            • jar
+                usage: domain- and path-scoped cookie jar forwarded with video and transcript requests.
+            • name
+                usage: cookie name taken from each storage-state entry.
+            • value
+                usage: cookie value taken from each storage-state entry.
+            • domain
+                usage: cookie domain preserved so the cookie is only sent to matching hosts.
+            • path
+                usage: cookie path preserved so the cookie is only sent to matching URLs.
+            • secure
+                usage: flag preserved so secure cookies are only sent over HTTPS.
+        Functions:
+            _COOKIE_FIELDS - extracts all five fields of a cookie in one C-level call.
+
+        Converts the storage-state cookie list into a requests cookie jar, keeping each cookie's domain and path so CDN hosts receive only the cookies scoped to them.
+        """
+        from requests.cookies import RequestsCookieJar
+
+        jar = RequestsCookieJar()
+        for name, value, domain, path, secure in map(_COOKIE_FIELDS, storage.get("cookies", [])):
+            jar.set(name, value, domain=domain, path=path, secure=secure)
+        return jar
+
+    def _panel(self, body: str, border_style: str):
+        """
+        Variables:
+            • body
+                usage: markup text shown inside the panel.
+            • border_style
+                usage: Rich style applied to the panel border on terminals.
+
+        Returns a fitted panel for terminal output, or the bare markup text when output is piped so no box layout is rendered.
+        """
+        if self._plain_output:
+            return body
+        return Panel.fit(body, border_style=border_style)
+
     def _print_banner(self) -> None:
         """
         Displays the command-line banner that introduces the downloader before interactive prompts begin.
         """
         self.console.print("")
         self.console.print(
-            Panel.fit(
+            self._panel(
                 "[bold cyan]Zoom Downloader[/bold cyan]\n"
                 "[dim]Download Zoom videos and transcripts[/dim]",
                 border_style="blue",
@@ -84,15 +165,15 @@ class ZoomDownloaderCLI:
         )
         self.console.print("")
 
-    def _run_login_flow(self, target_url: str | None = None) -> None:
+    def _run_login_flow(self, target_url: str | None = None, playwright=None) -> None:
         """
         Variables:
             • target_url
                 usage: optional page address used to trigger institution-specific SSO redirects when provided.
+            • playwright
+                usage: optional already-running Playwright driver reused to launch the login context; a new one is started when omitted.
             • login_url
                 usage: resolved navigation target that defaults to the Zoom profile page when no custom URL is supplied.
-            • playwright
-                usage: context manager object used to launch and manage a persistent browser context.
             • context
                 usage: persistent Chromium context where authenticated cookies and profile state are captured.
             • page
@@ -100,9 +181,17 @@ class ZoomDownloaderCLI:
         Functions:
             self.browser_session.get_browser_context - creates the persistent browser context used for manual login.
             self.browser_session.save_cookies - snapshots authenticated cookies before the browser context closes.
+            self.browser_session.flush - writes any deferred cookie snapshot once the context is closed.
 
         Opens an interactive browser session so the user can complete Zoom login and SSO/2FA, then persists the resulting session cookies for future commands.
         """
+        if playwright is None:
+            from playwright.sync_api import sync_playwright
+
+            with sync_playwright() as playwright:
+                self._run_login_flow(target_url, playwright=playwright)
+            return
+
         login_url = target_url or "https://zoom.us/profile"
 
         self.console.print(
@@ -111,19 +200,22 @@ class ZoomDownloaderCLI:
         )
         self.console.print("[yellow]Close the browser window when you are done.[/yellow]\n")
 
-        with sync_playwright() as playwright:
-            context = self.browser_session.get_browser_context(playwright, headless=False)
-            try:
-                page = context.new_page()
-                page.goto(login_url)
+        from playwright.sync_api import Error as PlaywrightError
 
-                try:
-                    page.wait_for_event("close", timeout=0)
-                except Exception:
-                    pass
-            finally:
-                self.browser_session.save_cookies(context)
-                context.close()
+        context = self.browser_session.get_browser_context(playwright, headless=False)
+        try:
+            page = context.new_page()
+            page.goto(login_url)
+
+            try:
+                page.wait_for_event("close", timeout=0)
+            except PlaywrightError:
+                # Closing the whole browser instead of the tab ends the wait this way.
+                pass
+        finally:
+            self.browser_session.save_cookies(context)
+            context.close()
+            self.browser_session.flush()
 
         self.console.print("[green]✓ Login session saved![/green]\n")
 
@@ -134,13 +226,21 @@ class ZoomDownloaderCLI:
                 usage: prompt shown to the user each time input is requested.
             • valid_choices
                 usage: set of accepted option values used to validate user input.
+            • single_key
+                usage: flag enabling one-keystroke selection when stdin is a terminal and every option is one character.
             • choice
                 usage: normalized user response that is checked against the accepted choices.
 
-        Repeatedly asks for user input until a valid menu value is entered, then returns the accepted choice.
+        Repeatedly asks for user input until a valid menu value is entered, then returns the accepted choice; on a terminal a single keypress is enough, while piped input still reads whole lines.
         """
+        single_key = sys.stdin.isatty() and all(len(option) == 1 for option in valid_choices)
         while True:
-            choice = click.prompt(prompt_text, type=str).strip()
+            if single_key:
+                self.console.print(f"{prompt_text}: ", end="")
+                choice = click.getchar()
+                self.console.print(choice, markup=False, highlight=False)
+            else:
+                choice = click.prompt(prompt_text, type=str).strip()
             if choice in valid_choices:
                 return choice
             self.console.print("[red]Invalid choice. Please select one of the shown options.[/red]")
@@ -153,7 +253,7 @@ class ZoomDownloaderCLI:
         Presents the download-target menu and returns the selected option for video, transcript, or both.
         """
         self.console.print(
-            Panel.fit(
+            self._panel(
                 "[bold]Choose what to download[/bold]\n\n"
                 "[cyan]1.[/cyan] Video\n"
                 "[cyan]2.[/cyan] Transcript\n"
@@ -177,7 +277,7 @@ class ZoomDownloaderCLI:
         Collects transcript formatting preferences and returns a style/format configuration dictionary for downstream processing.
         """
         self.console.print(
-            Panel.fit(
+            self._panel(
                 "[bold]Transcript Options[/bold]\n\n"
                 "[cyan]1.[/cyan] Paragraph (no timestamps, saved as .txt)\n"
                 "[cyan]2.[/cyan] With timestamps (like .vtt)",
@@ -192,7 +292,7 @@ class ZoomDownloaderCLI:
 
         self.console.print("")
         self.console.print(
-            Panel.fit(
+            self._panel(
                 "[bold]Timestamped Transcript Format[/bold]\n\n"
                 "[cyan]1.[/cyan] TXT\n"
                 "[cyan]2.[/cyan] VTT",
@@ -214,16 +314,24 @@ class ZoomDownloaderCLI:
 
         Normalizes a folder name so it is safe to create on disk and falls back to a default label when empty.
         """
-        clean = re.sub(r'[\\/:*?"<>|]+', "_", name).strip().strip(".")
+        clean = _INVALID_FS_CHARS_RE.sub("_", name).strip().strip(".")
         return clean or "Zoom_Recording"
 
-    def _choose_output_directory(self, default_folder_name: str) -> Path:
+    def _choose_output_directory(
+        self,
+        default_folder_name: str,
+        default_dir_ready: Future | None = None,
+    ) -> Path:
         """
         Variables:
             • default_folder_name
                 usage: suggested folder label that is shown when prompting for an output location.
+            • default_dir_ready
+                usage: optional background job creating the default folder while the user answers the prompt; its result tells whether the folder was new.
             • folder_name
                 usage: user-entered folder label that can override the default output folder name.
+            • default_name
+                usage: sanitized default folder name compared against the final choice.
             • chosen_name
                 usage: sanitized final folder name used to construct the output directory path.
             • output_dir
@@ -231,10 +339,10 @@ class ZoomDownloaderCLI:
         Functions:
             self._sanitize_folder_name - converts the chosen folder label into a filesystem-safe directory name.
 
-        Prompts for an output folder, sanitizes the chosen name, creates the directory, and returns the final path.
+        Prompts for an output folder, sanitizes the chosen name, creates the directory, and returns the final path; when the default folder was created speculatively and a different name is chosen, the unused folder is removed again.
         """
         self.console.print(
-            Panel.fit(
+            self._panel(
                 "[bold]Output Folder[/bold]\n\n"
                 f"Default: [cyan]{default_folder_name}[/cyan]\n"
                 "Enter a custom folder name, or press Enter to use the default.",
@@ -248,30 +356,104 @@ class ZoomDownloaderCLI:
             default="",
             show_default=False,
         ).strip()
+        default_name = self._sanitize_folder_name(default_folder_name)
         chosen_name = self._sanitize_folder_name(folder_name or default_folder_name)
         output_dir = Path.cwd() / chosen_name
+
+        # A failed speculative mkdir is ignored; the chosen folder is created below either way.
+        if (
+            default_dir_ready is not None
+            and default_dir_ready.exception() is None
+            and default_dir_ready.result()
+            and chosen_name != default_name
+        ):
+            try:
+                (Path.cwd() / default_name).rmdir()
+            except OSError:
+                pass
+
         output_dir.mkdir(parents=True, exist_ok=True)
         self.console.print(f"[green]Saving downloads to:[/green] {output_dir}")
         return output_dir
 
-    def _save_text_file(self, dest_path: Path, text: str) -> None:
+    def _save_transcript(
+        self,
+        transcript_url: str,
+        dest_path: Path,
+        transcript_prefs: dict[str, str] | None,
+        cookies: requests.cookies.RequestsCookieJar | None,
+        show_status: bool = True,
+    ) -> None:
         """
         Variables:
+            • transcript_url
+                usage: transcript endpoint streamed straight into the output file.
             • dest_path
-                usage: destination file path where transcript text is written.
-            • text
-                usage: transcript content that is persisted to the output file.
+                usage: destination file path where the VTT or converted transcript text is written.
+            • transcript_prefs
+                usage: transcript style and output format preferences selected by the user.
+            • cookies
+                usage: authenticated cookie jar forwarded with the transcript request.
+            • show_status
+                usage: flag that shows a spinner while streaming; disabled when a download progress bar is already active.
+            • status
+                usage: spinner context shown while streaming, or a no-op context when the spinner is disabled.
+            • chunks
+                usage: lazily fetched transcript fragments consumed by the writer or converter.
             • file
-                usage: open file handle used to write UTF-8 transcript content to disk.
+                usage: open file handle receiving the raw VTT bytes or the UTF-8 converted text.
+            • chunk
+                usage: iterated raw transcript fragment written byte for byte for VTT output.
+            • error
+                usage: captured failure details reported when the transcript cannot be streamed.
+        Functions:
+            self.download_service.iter_bytes - streams the undecoded VTT body for byte-exact saving.
+            self.download_service.iter_text - streams decoded transcript fragments from the network.
+            self.transcript_converter.stream_vtt_to_paragraph - converts streamed cues into paragraph-form plain text.
+            self.transcript_converter.stream_vtt_to_timestamped_txt - converts streamed cues into timestamped plain text.
 
-        Writes transcript text to the target file path and reports the saved file location to the user.
+        Streams the transcript from the network into the output file, converting cue by cue when plain text is requested, so memory stays bounded by a single cue; a partial file is removed on failure.
         """
-        with open(dest_path, "w", encoding="utf-8") as file:
-            file.write(text)
+        if transcript_prefs and transcript_prefs["format"] == "vtt":
+            self.console.print(f"\n[cyan]Saving Transcript (VTT) -> {dest_path}[/cyan]")
+        elif transcript_prefs and transcript_prefs["style"] == "paragraph":
+            self.console.print(f"\n[cyan]Saving Transcript Paragraph -> {dest_path}[/cyan]")
+        else:
+            self.console.print(
+                f"\n[cyan]Saving Timestamped Transcript (TXT) -> {dest_path}[/cyan]"
+            )
+
+        status = (
+            self.console.status("[cyan]Fetching transcript...[/cyan]", spinner="dots")
+            if show_status
+            else nullcontext()
+        )
+        try:
+            if transcript_prefs and transcript_prefs["format"] == "vtt":
+                # Saved exactly as served: no charset guess and no newline translation.
+                with status, open(dest_path, "wb") as file:
+                    for chunk in self.download_service.iter_bytes(transcript_url, cookies=cookies):
+                        file.write(chunk)
+            else:
+                with status, open(dest_path, "w", encoding="utf-8") as file:
+                    chunks = self.download_service.iter_text(transcript_url, cookies=cookies)
+                    if transcript_prefs and transcript_prefs["style"] == "paragraph":
+                        self.transcript_converter.stream_vtt_to_paragraph(chunks, file)
+                    else:
+                        self.transcript_converter.stream_vtt_to_timestamped_txt(chunks, file)
+        except Exception as error:
+            dest_path.unlink(missing_ok=True)
+            self.console.print(f"[red]Failed to fetch text: {error}[/red]")
+            self.console.print("[red]Transcript fetch failed. Nothing was saved.[/red]")
+            return
+
         self.console.print(f"[green]✓ Successfully saved: {dest_path}[/green]")
 
-    def _ensure_logged_in(self) -> bool:
+    def _ensure_logged_in(self, playwright=None) -> bool:
         """
+        Variables:
+            • playwright
+                usage: optional already-running Playwright driver forwarded to the login flow so no second driver is started.
         Functions:
             self.browser_session.is_logged_in - checks whether a reusable authenticated Zoom session is already available.
             self._run_login_flow - launches the manual login process when no valid session exists.
@@ -285,7 +467,7 @@ class ZoomDownloaderCLI:
             "[red]⚠  You are not logged in.[/red]  "
             "A browser will open so you can sign in first."
         )
-        self._run_login_flow()
+        self._run_login_flow(playwright=playwright)
 
         if self.browser_session.is_logged_in():
             return True
@@ -319,92 +501,105 @@ class ZoomDownloaderCLI:
             • transcript_prefs
                 usage: transcript style and output format preferences selected by the user when transcript download is enabled.
             • playwright
-                usage: context manager handle used to open the browser context for scraping recording metadata.
+                usage: single Playwright driver shared by the login check and the scraping browser context.
             • media_info
-                usage: scraped metadata container holding the recording title and discovered media URLs.
+                usage: scraped metadata container holding the recording title and discovered media URLs, from the direct page fetch or the browser.
             • title
                 usage: recording title used as the base filename for saved media assets.
             • video_url
                 usage: direct URL used to download the recording video when available.
             • transcript_url
                 usage: transcript endpoint URL used for VTT download or text conversion.
-            • browser_cookies
-                usage: raw cookie objects extracted from the authenticated browser context.
-            • cookie
-                usage: iterated browser-cookie object transformed into a name-to-value cookie mapping for HTTP requests.
-            • cookies_dict
-                usage: simplified cookie jar passed to HTTP requests for authenticated media access.
+            • storage
+                usage: storage-state snapshot captured once and reused for both the cookie jar and the saved session.
+            • cookie_jar
+                usage: scoped cookie jar passed to HTTP requests for authenticated media access.
+            • default_dir
+                usage: default output folder derived from the title and created ahead of the folder prompt.
+            • default_dir_ready
+                usage: background mkdir job for the default folder, awaited once the folder is chosen.
             • output_dir
                 usage: directory path where all selected output files for the recording are saved.
-            • video_dest
-                usage: destination path for the downloaded MP4 file when video download is selected.
-            • transcript_dest
-                usage: destination path for either VTT transcript download or converted TXT output.
-            • vtt_text
-                usage: raw transcript payload fetched for conversion when plain-text output is requested.
-            • text_content
-                usage: final transcript text produced from conversion and written to disk.
         Functions:
             self._print_banner - renders the CLI header before interactive prompts.
             self._ensure_logged_in - verifies authentication and triggers login flow if required.
             self._prompt_download_target - captures which recording assets should be downloaded.
             self._prompt_transcript_preferences - captures transcript style and format options.
+            self.browser_session.load_cookies - reads the saved session cookies for the browser-free transcript lookup.
+            self.media_scraper.extract_transcript_info_fast - finds the transcript URL over plain HTTP for transcript-only runs.
             self.browser_session.get_browser_context - creates the authenticated browser context for scraping.
             self.media_scraper.extract_media_info - extracts title and media URLs from the recording page.
-            self.browser_session.save_cookies - persists current browser cookies before closing the context.
+            self._build_cookie_jar - converts saved or captured storage-state cookies into a scoped HTTP cookie jar.
+            self.browser_session.save_cookies - persists the captured storage state before closing the context.
+            self.browser_session.flush - writes any deferred cookie snapshot once the context is closed.
             self._choose_output_directory - creates and returns the destination directory for downloaded files.
-            self.download_service.download_file - downloads video or transcript files to local storage.
-            self.download_service.fetch_text - retrieves transcript text for conversion when needed.
-            self.transcript_converter.vtt_to_paragraph - converts VTT cues into paragraph-form plain text.
-            self.transcript_converter.vtt_to_timestamped_txt - converts VTT cues into timestamped plain text.
-            self._save_text_file - writes converted transcript text to disk.
+            self._download_assets - downloads the selected video and transcript outputs concurrently.
 
-        Orchestrates the full recording download flow from URL validation and authentication through media scraping, file download, transcript conversion, and final output persistence.
+        Orchestrates the full recording download flow from URL validation and authentication through media scraping, file download, transcript conversion, and final output persistence; transcript-only runs first try to read the transcript URL without opening the browser.
         """
+        from zoom_downloader.scraper import ZOOM_URL_RE
+
         self._print_banner()
         if not url:
             url = click.prompt("Paste Zoom recording URL", type=str).strip()
 
-        if not url.startswith(("http://", "https://")):
+        # Zoom-hosted pages only; anything else would just time out in the scraper.
+        if not ZOOM_URL_RE.match(url):
             self.console.print(
                 "[red]Invalid URL. Please provide a full http(s) Zoom recording URL.[/red]"
             )
             return
 
-        if not self._ensure_logged_in():
-            return
+        from playwright.sync_api import sync_playwright
 
-        choice = self._prompt_download_target()
-        download_video_opt = choice in ("1", "3")
-        download_transcript_opt = choice in ("2", "3")
+        with sync_playwright() as playwright:
+            if not self._ensure_logged_in(playwright):
+                return
 
-        transcript_prefs = None
-        if download_transcript_opt:
-            self.console.print("")
-            transcript_prefs = self._prompt_transcript_preferences()
+            choice = self._prompt_download_target()
+            download_video_opt = choice in ("1", "3")
+            download_transcript_opt = choice in ("2", "3")
 
-        with sync_playwright() as playwright:
-            self.console.print(
-                "[cyan]Opening browser to extract recording data...[/cyan]\n"
-                "[yellow]A browser window will open. If prompted, "
-                "complete SSO / 2FA login.[/yellow]\n"
-                "[yellow]The window will close automatically once "
-                "the recording info is captured.[/yellow]"
-            )
-            context = self.browser_session.get_browser_context(playwright, headless=False)
-            try:
-                media_info = self.media_scraper.extract_media_info(context, url)
-                title = media_info.get("title", "Zoom_Recording")
-                video_url = media_info.get("video_url")
-                transcript_url = media_info.get("transcript_url")
+            transcript_prefs = None
+            if download_transcript_opt:
+                self.console.print("")
+                transcript_prefs = self._prompt_transcript_preferences()
 
-                browser_cookies = context.cookies()
-                cookies_dict = {cookie["name"]: cookie["value"] for cookie in browser_cookies}
-            finally:
-                self.browser_session.save_cookies(context)
-                context.close()
+            media_info = None
+            if not download_video_opt:
+                cookie_jar = self._build_cookie_jar(
+                    {"cookies": self.browser_session.load_cookies()}
+                )
+                media_info = self.media_scraper.extract_transcript_info_fast(
+                    url, self.download_service.session, cookie_jar
+                )
 
-        output_dir = self._choose_output_directory(title)
+            if media_info is None:
+                self.console.print(
+                    "[cyan]Opening browser to extract recording data...[/cyan]\n"
+                    "[yellow]A browser window will open. If prompted, "
+                    "complete SSO / 2FA login.[/yellow]\n"
+                    "[yellow]The window will close automatically once "
+                    "the recording info is captured.[/yellow]"
+                )
+                context = self.browser_session.get_browser_context(playwright, headless=False)
+                storage = None
+                try:
+                    media_info = self.media_scraper.extract_media_info(context, url)
+                    storage = context.storage_state()
+                    cookie_jar = self._build_cookie_jar(storage)
+                finally:
+                    self.browser_session.save_cookies(context, storage=storage)
+                    context.close()
+                    self.browser_session.flush()
+
+        title = media_info.get("title", "Zoom_Recording")
+        video_url = media_info.get("video_url")
+        transcript_url = media_info.get("transcript_url")
+        default_dir = Path.cwd() / self._sanitize_folder_name(title)
+        default_dir_ready = _BACKGROUND_EXECUTOR.submit(_create_dir, default_dir)
+
+        output_dir = self._choose_output_directory(title, default_dir_ready=default_dir_ready)
 
         if not video_url and download_video_opt:
             self.console.print(
@@ -418,55 +613,277 @@ class ZoomDownloaderCLI:
                 "It might not exist for this recording.[/yellow]"
             )
 
-        if download_video_opt and video_url:
-            video_dest = output_dir / f"{title}.mp4"
-            self.console.print(f"\n[cyan]Downloading Video -> {video_dest}[/cyan]")
-            self.download_service.download_file(
-                video_url,
-                str(video_dest),
-                description="Downloading Video",
-                cookies=cookies_dict,
-            )
+        self._download_assets(
+            title=title,
+            output_dir=output_dir,
+            video_url=video_url if download_video_opt else None,
+            transcript_url=transcript_url if download_transcript_opt else None,
+            transcript_prefs=transcript_prefs,
+            cookies=cookie_jar,
+        )
 
-        if download_transcript_opt and transcript_url:
-            if transcript_prefs and transcript_prefs["format"] == "vtt":
-                transcript_dest = output_dir / f"{title}.vtt"
-                self.console.print(
-                    f"\n[cyan]Downloading Transcript (VTT) -> {transcript_dest}[/cyan]"
-                )
-                self.download_service.download_file(
-                    transcript_url,
-                    str(transcript_dest),
-                    description="Downloading Transcript",
-                    cookies=cookies_dict,
-                )
+    def download_many(self, urls: list[str], concurrency: int = 4) -> None:
+        """
+        Variables:
+            • urls
+                usage: recording page addresses to download with one shared set of choices.
+            • concurrency
+                usage: maximum number of recordings whose files are transferred at the same time.
+            • invalid
+                usage: entries that are not http(s) URLs and are skipped with a warning.
+            • url
+                usage: iterated address checked against the Zoom URL pattern.
+            • choice
+                usage: menu selection applied to every recording in the batch.
+            • download_video_opt
+                usage: flag indicating whether video assets should be downloaded for this batch.
+            • download_transcript_opt
+                usage: flag indicating whether transcript assets should be downloaded for this batch.
+            • transcript_prefs
+                usage: transcript style and output format preferences applied to every recording.
+            • playwright
+                usage: single Playwright driver shared by the login check and all scraping.
+            • context
+                usage: one authenticated browser context reused to scrape every recording page.
+            • storage
+                usage: storage-state snapshot captured once after scraping and reused for the cookie jar and the saved session.
+            • recordings
+                usage: scraped title and media URLs for each recording that could be read.
+            • media_info
+                usage: scraped metadata container for the current recording.
+            • cookie_jar
+                usage: scoped cookie jar shared by every transfer in the batch.
+            • used_names
+                usage: folder names already assigned in this batch so recordings with the same title do not overwrite each other.
+            • jobs
+                usage: per-recording download arguments prepared before transfers start.
+            • base_name
+                usage: sanitized recording title used as the default folder name.
+            • suffix
+                usage: counter appended to the folder name when the same title appears more than once.
+            • folder_name
+                usage: default folder name for the current recording, suffixed when it repeats.
+            • output_dir
+                usage: directory created for the current recording's files.
+            • progress
+                usage: one progress display shared by all concurrent video downloads.
+            • failed
+                usage: recording URLs whose pages could not be read, listed in the end-of-run summary.
+            • video_parts
+                usage: byte ranges per video, chosen so all concurrent recordings fit the shared connection pool.
+            • executor
+                usage: thread pool that runs up to concurrency recordings at once.
+            • futures
+                usage: pending recording jobs awaited so worker errors surface.
+        Functions:
+            self._print_banner - renders the CLI header before interactive prompts.
+            self._ensure_logged_in - verifies authentication once for the whole batch.
+            self._prompt_download_target - captures which recording assets should be downloaded.
+            self._prompt_transcript_preferences - captures transcript style and format options.
+            self.browser_session.get_browser_context - creates the authenticated browser context shared by all scrapes.
+            self.media_scraper.extract_many - scrapes every recording page through one reused browser tab.
+            self._build_cookie_jar - converts the captured storage-state cookies into a scoped HTTP cookie jar.
+            self.browser_session.save_cookies - persists the captured storage state before closing the context.
+            self._sanitize_folder_name - turns each recording title into its default folder name.
+            self.download_service.new_progress - builds the shared progress display.
+            self._download_assets - downloads one recording's selected video and transcript outputs.
+
+        Downloads several recordings in one run: the login check, prompts, browser, and HTTP connection pool are set up once, pages are scraped one after another in a single browser context, and the file transfers then run concurrently.
+        """
+        from playwright.sync_api import sync_playwright
+
+        from zoom_downloader.downloader import HTTP_POOL_MAXSIZE
+        from zoom_downloader.scraper import ZOOM_URL_RE
+
+        self._print_banner()
+        invalid = [url for url in urls if not ZOOM_URL_RE.match(url)]
+        for url in invalid:
+            self.console.print(f"[yellow]Skipping invalid URL:[/yellow] {url}")
+        urls = [url for url in urls if url not in invalid]
+        if not urls:
+            self.console.print("[red]No valid Zoom recording URLs were given.[/red]")
+            return
+
+        with sync_playwright() as playwright:
+            if not self._ensure_logged_in(playwright):
                 return
 
-            vtt_text = self.download_service.fetch_text(
-                transcript_url,
-                cookies=cookies_dict,
-                description="Fetching transcript",
+            choice = self._prompt_download_target()
+            download_video_opt = choice in ("1", "3")
+            download_transcript_opt = choice in ("2", "3")
+
+            transcript_prefs = None
+            if download_transcript_opt:
+                self.console.print("")
+                transcript_prefs = self._prompt_transcript_preferences()
+
+            self.console.print(
+                f"[cyan]Opening browser to extract data for {len(urls)} recordings...[/cyan]\n"
+                "[yellow]The window will close automatically once "
+                "every recording has been read.[/yellow]"
+            )
+            context = self.browser_session.get_browser_context(playwright, headless=False)
+            storage = None
+            recordings: list[tuple[str, str | None, str | None]] = []
+            failed: list[str] = []
+            try:
+                for url, media_info in self.media_scraper.extract_many(context, urls):
+                    if media_info is None:
+                        failed.append(url)
+                        continue
+                    recordings.append(
+                        (
+                            media_info.get("title", "Zoom_Recording"),
+                            media_info.get("video_url"),
+                            media_info.get("transcript_url"),
+                        )
+                    )
+
+                storage = context.storage_state()
+                cookie_jar = self._build_cookie_jar(storage)
+            finally:
+                self.browser_session.save_cookies(context, storage=storage)
+                context.close()
+                self.browser_session.flush()
+
+        used_names: set[str] = set()
+        jobs = []
+        for title, video_url, transcript_url in recordings:
+            folder_name = base_name = self._sanitize_folder_name(title)
+            suffix = 2
+            while folder_name in used_names:
+                folder_name = f"{base_name} ({suffix})"
+                suffix += 1
+            used_names.add(folder_name)
+            output_dir = Path.cwd() / folder_name
+            output_dir.mkdir(parents=True, exist_ok=True)
+
+            if not video_url and download_video_opt:
+                self.console.print(f"[red]Could not find the Video URL for {title}.[/red]")
+            if not transcript_url and download_transcript_opt:
+                self.console.print(f"[yellow]Could not find a Transcript URL for {title}.[/yellow]")
+
+            jobs.append(
+                {
+                    "title": title,
+                    "output_dir": output_dir,
+                    "video_url": video_url if download_video_opt else None,
+                    "transcript_url": transcript_url if download_transcript_opt else None,
+                    "transcript_prefs": transcript_prefs,
+                    "cookies": cookie_jar,
+                }
             )
-            if not vtt_text:
-                self.console.print("[red]Transcript fetch failed. Nothing was saved.[/red]")
-                return
 
-            transcript_dest = output_dir / f"{title}.txt"
-            if transcript_prefs and transcript_prefs["style"] == "paragraph":
-                text_content = self.transcript_converter.vtt_to_paragraph(vtt_text)
-                self.console.print(
-                    f"\n[cyan]Saving Transcript Paragraph -> {transcript_dest}[/cyan]"
+        # Every range of every concurrent video shares one per-host pool, so more recordings
+        # at once means fewer ranges each instead of connections opened and thrown away.
+        concurrency = max(1, min(concurrency, HTTP_POOL_MAXSIZE))
+        video_parts = HTTP_POOL_MAXSIZE // concurrency
+        with (
+            self.download_service.new_progress() as progress,
+            ThreadPoolExecutor(max_workers=concurrency) as executor,
+        ):
+            futures = [
+                executor.submit(
+                    self._download_assets, **job, progress=progress, video_parts=video_parts
                 )
-            else:
-                text_content = self.transcript_converter.vtt_to_timestamped_txt(vtt_text)
-                self.console.print(
-                    f"\n[cyan]Saving Timestamped Transcript (TXT) -> {transcript_dest}[/cyan]"
+                for job in jobs
+            ]
+            for future in futures:
+                future.result()
+
+        self.console.print(f"\n[green]✓ Processed {len(jobs)} of {len(urls)} recordings.[/green]")
+        for url in failed:
+            self.console.print(f"[red]Could not read recording:[/red] {url}")
+
+    def _download_assets(
+        self,
+        title: str,
+        output_dir: Path,
+        video_url: str | None,
+        transcript_url: str | None,
+        transcript_prefs: dict[str, str] | None,
+        cookies: requests.cookies.RequestsCookieJar | None,
+        progress: Progress | None = None,
+        video_parts: int = 4,
+    ) -> None:
+        """
+        Variables:
+            • title
+                usage: recording title used as the base filename for saved media assets.
+            • output_dir
+                usage: directory path where all selected output files for the recording are saved.
+            • video_url
+                usage: video URL to download, or None when video was not requested or not found.
+            • transcript_url
+                usage: transcript URL to fetch, or None when transcripts were not requested or not found.
+            • transcript_prefs
+                usage: transcript style and output format preferences selected by the user.
+            • cookies
+                usage: authenticated cookie jar forwarded with every HTTP request.
+            • progress
+                usage: optional progress display shared by a batch of concurrent recordings.
+            • video_parts
+                usage: number of concurrent byte ranges used for the video download.
+            • video_dest
+                usage: destination path for the downloaded MP4 file when a video URL is available.
+            • transcript_dest
+                usage: destination path for the VTT or converted TXT transcript output.
+            • executor
+                usage: single-worker pool that streams the transcript while the video downloads.
+            • transcript_future
+                usage: pending transcript job awaited after the video finishes.
+        Functions:
+            self.download_service.download_file_ranged - downloads the video file to local storage as concurrent byte ranges.
+            self._save_transcript - streams and converts the transcript into its output file on a background worker.
+
+        Downloads the selected recording assets, overlapping the transcript fetch with the video download so the run takes as long as the slower transfer rather than both combined.
+        """
+        video_dest = output_dir / f"{title}.mp4" if video_url else None
+        transcript_dest = None
+        if transcript_url:
+            suffix = "vtt" if transcript_prefs and transcript_prefs["format"] == "vtt" else "txt"
+            transcript_dest = output_dir / f"{title}.{suffix}"
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            transcript_future = None
+            if transcript_dest is not None:
+                transcript_future = executor.submit(
+                    self._save_transcript,
+                    transcript_url,
+                    transcript_dest,
+                    transcript_prefs,
+                    cookies,
+                    show_status=video_dest is None and progress is None,
                 )
 
-            self._save_text_file(transcript_dest, text_content)
+            if video_dest is not None:
+                self.console.print(f"\n[cyan]Downloading Video -> {video_dest}[/cyan]")
+                self.download_service.download_file_ranged(
+                    video_url,
+                    str(video_dest),
+                    description="Downloading Video" if progress is None else title,
+                    cookies=cookies,
+                    progress=progress,
+                    parts=video_parts,
+                )
 
+            if transcript_future is not None:
+                transcript_future.result()
 
-app = ZoomDownloaderCLI()
+
+def _create_dir(path: Path) -> bool:
+    """
+    Variables:
+        • path
+            usage: directory created with any missing parents.
+
+    Creates a directory and returns whether it was newly created, so speculative creations can be undone safely.
+    """
+    try:
+        path.mkdir(parents=True)
+    except FileExistsError:
+        return False
+    return True
 
 
 @click.group()
@@ -479,11 +896,12 @@ def cli():
 def login():
     """
     Functions:
-        app.login - runs the main login workflow that opens a browser and persists session state.
+        ZoomDownloaderCLI - builds the CLI coordinator and its services only when the command runs.
+        ZoomDownloaderCLI.login - runs the main login workflow that opens a browser and persists session state.
 
     Invokes the login subcommand to capture and store an authenticated Zoom session for later downloads.
     """
-    app.login()
+    ZoomDownloaderCLI().login()
 
 
 @cli.command()
@@ -494,11 +912,55 @@ def download(url):
         • url
             usage: optional recording URL argument forwarded into the main download workflow.
     Functions:
-        app.download - executes the interactive download workflow for recording assets.
+        ZoomDownloaderCLI - builds the CLI coordinator and its services only when the command runs.
+        ZoomDownloaderCLI.download - executes the interactive download workflow for recording assets.
 
     Invokes the download subcommand and forwards the optional URL into the main downloader workflow.
     """
-    app.download(url)
+    ZoomDownloaderCLI().download(url)
+
+
+@cli.command("download-many")
+@click.argument("urls", nargs=-1)
+@click.option(
+    "--file",
+    "url_file",
+    type=click.File("r"),
+    help="Text file with one recording URL per line.",
+)
+@click.option(
+    "--concurrency",
+    default=4,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Recordings downloaded at the same time.",
+)
+def download_many(urls, url_file, concurrency):
+    """
+    Variables:
+        • urls
+            usage: recording URLs given directly on the command line.
+        • url_file
+            usage: optional text file with one recording URL per line; blank lines and # comments are ignored.
+        • concurrency
+            usage: maximum number of recordings transferred at the same time.
+        • targets
+            usage: combined list of recording URLs from arguments and the file.
+        • line
+            usage: iterated file line stripped and kept when it holds a URL.
+    Functions:
+        ZoomDownloaderCLI - builds the CLI coordinator and its services only when the command runs.
+        ZoomDownloaderCLI.download_many - downloads every listed recording with shared login, browser, and connections.
+
+    Invokes the batch download subcommand for several recordings at once.
+    """
+    targets = list(urls)
+    if url_file is not None:
+        for line in url_file:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                targets.append(line)
+    ZoomDownloaderCLI().download_many(targets, concurrency=concurrency)
 
 
 if __name__ == "__main__":
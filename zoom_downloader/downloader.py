@@ -6,9 +6,291 @@ Design note:
 - Keep function wrappers for compatibility with existing call sites.
 """
 
+import atexit
+import gzip
+import hashlib
+import os
+import queue
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext, suppress
+from pathlib import Path
+
 import requests
+from requests.adapters import HTTPAdapter
 from rich.console import Console
 from rich.progress import BarColumn, DownloadColumn, Progress, TextColumn, TransferSpeedColumn
+from urllib3.util.retry import Retry
+
+from zoom_downloader.browser import STATE_ROOT
+
+DEFAULT_TEXT_CACHE_DIR = STATE_ROOT / "transcripts"
+
+# Installed once on every service session, so individual requests never pass headers.
+_DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "Referer": "https://zoom.us/",
+}
+
+# Files smaller than this finish quickly on one stream, so splitting them is not worth the
+# extra requests.
+_RANGED_MIN_BYTES = 50 * 1024 * 1024
+# Upper bound per range request; more, smaller ranges balance load across uneven connections.
+_RANGE_MAX_BYTES = 32 * 1024 * 1024
+_CONTENT_RANGE_TOTAL_RE = re.compile(r"/(\d+)\s*$")
+# Large reads and writes keep per-chunk syscall and queue overhead negligible on multi-GB videos.
+_STREAM_CHUNK_BYTES = 1024 * 1024
+# Progress is advanced at most once per this many bytes to keep Rich redraw work off the read loop.
+_PROGRESS_STEP_BYTES = 1024 * 1024
+# File buffer for downloads; at least the default chunk size so smaller configured
+# chunks are coalesced into large write(2) calls instead of 8 KiB ones.
+_WRITE_BUFFER_BYTES = 1024 * 1024
+# Chunks buffered between the network reader and the disk writer (about 4 MB at 1 MB each).
+_WRITE_QUEUE_DEPTH = 4
+# Written video data is released from the page cache in steps of this size, so a
+# multi-GB download never displaces the rest of the host's cached files.
+_CACHE_RELEASE_BYTES = 64 * 1024 * 1024
+
+
+class TextCache:
+    """
+    Gzip-compressed on-disk cache for fetched text payloads, keyed by URL, fronted by a small in-memory LRU of recent entries.
+
+    Variables:
+    - cache_dir
+      usage: directory holding one compressed entry per cached URL.
+    - ttl
+      usage: maximum entry age in seconds before the payload is fetched again.
+    - memory_entries
+      usage: number of recent payloads kept decompressed in memory; only payloads fetched whole with fetch_text enter it.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        ttl: float = 3600.0,
+        memory_entries: int = 32,
+    ):
+        """
+        Variables:
+            • cache_dir
+                usage: optional cache directory; defaults to the transcripts folder under the local state directory.
+            • ttl
+                usage: entry lifetime in seconds measured from the time the entry was written.
+            • memory_entries
+                usage: LRU capacity for decompressed payloads; 0 disables the in-memory layer.
+
+        Configures where cached text lives, how long an entry stays valid, and how many recent entries are served from memory.
+        """
+        self.cache_dir = Path(cache_dir or DEFAULT_TEXT_CACHE_DIR)
+        self.ttl = ttl
+        self.memory_entries = memory_entries
+        self._recent: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _entry_path(self, url: str) -> Path:
+        """
+        Returns the cache file path for a URL, named by the SHA-256 digest of the URL.
+        """
+        return self.cache_dir / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.gz"
+
+    def read(self, url: str, remember: bool = True) -> str | None:
+        """
+        Variables:
+            • url
+                usage: source URL whose cached payload is looked up.
+            • remember
+                usage: whether a payload read from disk is promoted into the in-memory layer; streaming callers pass False.
+            • entry
+                usage: in-memory (write time, text) pair for the URL, if recently used.
+            • path
+                usage: cache file for the URL.
+            • written_at
+                usage: modification time of the cache file, the moment the entry was written.
+            • file
+                usage: decompressing text reader over the cache entry.
+            • text
+                usage: payload decompressed from disk, optionally promoted into the in-memory layer.
+        Functions:
+            self._entry_path - maps the URL to its cache file.
+            self._remember - keeps the payload in the in-memory LRU.
+
+        Returns the cached text for a URL when an entry exists and is younger than the TTL, or None when it is missing, expired, or unreadable; recent entries are answered from memory without touching the disk, and expired entries are deleted when found.
+        """
+        with self._lock:
+            entry = self._recent.get(url)
+            if entry is not None:
+                if time.time() - entry[0] <= self.ttl:
+                    self._recent.move_to_end(url)
+                    return entry[1]
+                del self._recent[url]
+
+        path = self._entry_path(url)
+        try:
+            written_at = path.stat().st_mtime
+            if time.time() - written_at > self.ttl:
+                path.unlink(missing_ok=True)
+                return None
+            with gzip.open(path, "rt", encoding="utf-8") as file:
+                text = file.read()
+        except (OSError, EOFError, UnicodeDecodeError):
+            return None
+        if remember:
+            self._remember(url, text, written_at)
+        return text
+
+    def write(self, url: str, text: str) -> None:
+        """
+        Variables:
+            • url
+                usage: source URL the payload is cached under.
+            • text
+                usage: complete payload stored on disk and in memory.
+        Functions:
+            self.write_through - compresses the payload into the cache.
+            self._remember - keeps the payload in the in-memory LRU.
+
+        Caches a payload that was fetched in one piece; it is already held whole, so it also enters the in-memory layer.
+        """
+        for _ in self.write_through(url, (text,)):
+            pass
+        self._remember(url, text, time.time())
+
+    def _remember(self, url: str, text: str, written_at: float) -> None:
+        """
+        Variables:
+            • url
+                usage: source URL used as the LRU key.
+            • text
+                usage: decompressed payload kept in memory.
+            • written_at
+                usage: time the entry was written, so in-memory entries expire with their disk copy.
+
+        Inserts or refreshes an in-memory entry and evicts the least recently used ones beyond the configured capacity.
+        """
+        if self.memory_entries <= 0:
+            return
+        with self._lock:
+            self._recent[url] = (written_at, text)
+            self._recent.move_to_end(url)
+            while len(self._recent) > self.memory_entries:
+                self._recent.popitem(last=False)
+
+    def write_through(
+        self,
+        url: str,
+        chunks: Iterable[str],
+        on_error: Callable[[OSError], None] | None = None,
+    ) -> Iterator[str]:
+        """
+        Variables:
+            • url
+                usage: source URL the streamed payload is cached under.
+            • chunks
+                usage: text fragments passed through to the caller while being compressed into the cache.
+            • on_error
+                usage: optional callback told about a cache write failure, after which the stream continues uncached; without it the failure is raised.
+            • fd
+                usage: descriptor of the temporary entry written next to the final cache file.
+            • tmp_path
+                usage: temporary entry path moved into place only after the whole stream was read.
+            • raw
+                usage: binary handle over the temporary entry.
+            • file
+                usage: compressing text writer layered over the temporary entry.
+            • caching
+                usage: whether fragments are still being written to the cache; cleared after a write failure.
+            • chunk
+                usage: iterated text fragment written to the cache and yielded unchanged.
+            • handle
+                usage: iterated cache file handle closed during cleanup.
+            • error
+                usage: cache write failure reported through on_error or raised.
+        Functions:
+            self._entry_path - maps the URL to its cache file.
+
+        Yields every fragment of a text stream while compressing it into the on-disk cache; the entry is published atomically once the stream completes, so an interrupted fetch never leaves a truncated entry. Streamed payloads skip the in-memory layer so the stream never has to be held whole. Only cache file operations are guarded, so errors raised by the stream itself always reach the caller.
+        """
+        raw = file = tmp_path = None
+        caching = True
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=".text.", suffix=".tmp")
+            raw = os.fdopen(fd, "wb")
+            file = gzip.open(raw, "wt", encoding="utf-8", compresslevel=6)
+        except OSError as error:
+            if on_error is None:
+                raise
+            on_error(error)
+            caching = False
+
+        try:
+            for chunk in chunks:
+                if caching:
+                    try:
+                        file.write(chunk)
+                    except OSError as error:
+                        if on_error is None:
+                            raise
+                        on_error(error)
+                        caching = False
+                yield chunk
+            if caching:
+                try:
+                    file.close()
+                    raw.close()
+                    os.replace(tmp_path, self._entry_path(url))
+                except OSError as error:
+                    if on_error is None:
+                        raise
+                    on_error(error)
+        finally:
+            # A failed write leaves buffered data that fails again on close.
+            for handle in (file, raw):
+                if handle is not None:
+                    with suppress(OSError):
+                        handle.close()
+            if tmp_path is not None:
+                with suppress(OSError):
+                    os.unlink(tmp_path)
+
+# Connections kept open per host; batch downloads split them between concurrent recordings.
+HTTP_POOL_MAXSIZE = 16
+
+
+def build_http_session() -> requests.Session:
+    """
+    Variables:
+        • session
+            usage: keep-alive HTTP session whose HTTPS connection pool is shared across downloads.
+        • retries
+            usage: retry policy that re-issues idempotent requests after connection errors or transient gateway statuses.
+        • adapter
+            usage: pooled transport mounted for HTTPS so repeated requests to Zoom reuse open connections.
+
+    Creates the HTTP session used for every video and transcript request so one TLS connection per host is reused across a run and brief Zoom gateway errors are retried instead of failing the download.
+    """
+    session = requests.Session()
+    retries = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        # Return the last response so raise_for_status reports the real HTTP error.
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=retries)
+    session.mount("https://", adapter)
+    return session
 
 
 class DownloadService:
@@ -20,34 +302,70 @@ class DownloadService:
       usage: Rich console instance for progress and status messages.
     - timeout
       usage: network timeout in seconds for all requests.
+    - session
+      usage: keep-alive HTTP session reused by every request so connections and TLS handshakes are pooled.
+    - text_cache
+      usage: optional on-disk cache consulted by iter_text before fetching transcript text.
+    - chunk_size
+      usage: bytes requested per read when streaming video files to disk.
     """
 
-    def __init__(self, console_instance: Console | None = None, timeout: int = 120):
+    def __init__(
+        self,
+        console_instance: Console | None = None,
+        timeout: int = 120,
+        session: requests.Session | None = None,
+        text_cache: TextCache | None = None,
+        chunk_size: int = _STREAM_CHUNK_BYTES,
+    ):
         """
         Variables:
             • console_instance
                 usage: optional terminal renderer injected so callers can control output behavior.
             • timeout
                 usage: request timeout value in seconds applied to all network operations.
+            • session
+                usage: optional shared HTTP session; a pooled session with retries is created when none is supplied.
+            • text_cache
+                usage: optional text cache; streamed text is fetched every time when none is supplied.
+            • chunk_size
+                usage: bytes requested per read when streaming video files; large values keep per-chunk Python overhead negligible.
+        Functions:
+            build_http_session - creates the default pooled, retrying HTTP session.
 
-        Configures the download service with a console for status output and a shared request timeout setting.
+        Configures the download service with a console for status output, a shared request timeout setting, a reusable HTTP session carrying the standard request headers, and an optional text cache.
         """
         self.console = console_instance or Console()
         self.timeout = timeout
+        self.session = session or build_http_session()
+        self.session.headers.update(_DEFAULT_HEADERS)
+        self.text_cache = text_cache
+        self.chunk_size = chunk_size
+
+    def close(self) -> None:
+        """
+        Closes the HTTP session and its pooled connections.
+        """
+        self.session.close()
 
     @staticmethod
     def request_headers() -> dict[str, str]:
         """
-        Returns the standard HTTP headers used for authenticated Zoom media and transcript requests.
+        Returns a copy of the standard HTTP headers used for authenticated Zoom media and transcript requests.
+        """
+        return dict(_DEFAULT_HEADERS)
+
+    @staticmethod
+    def new_progress() -> Progress:
+        """
+        Returns a progress display with the standard download columns, usable as a shared display for several concurrent downloads.
         """
-        return {
-            "User-Agent": (
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/120.0.0.0 Safari/537.36"
-            ),
-            "Referer": "https://zoom.us/",
-        }
+        return Progress(
+            TextColumn("[bold blue]{task.description}"),
+            BarColumn(),
+            DownloadColumn(),
+            TransferSpeedColumn(),
+        )
 
     def download_file(
         self,
@@ -55,6 +373,7 @@ class DownloadService:
         dest_path: str,
         description: str = "Downloading",
         cookies: dict | None = None,
+        progress: Progress | None = None,
     ) -> bool:
         """
         Variables:
@@ -66,30 +385,31 @@ class DownloadService:
                 usage: progress-task label shown in the terminal while downloading.
             • cookies
                 usage: authenticated cookie jar forwarded with the request for protected resources.
+            • progress
+                usage: optional shared progress display; a private one is opened when none is supplied.
             • response
                 usage: streamed network response used to read file bytes and metadata.
             • total_size
                 usage: content-length value used to configure total progress for the download task.
-            • progress
-                usage: context manager that renders download progress columns in the terminal.
+            • display
+                usage: context manager that renders download progress, or leaves an already running shared display untouched.
             • task
                 usage: progress task handle updated as each data chunk is written.
             • file
                 usage: output stream that persists downloaded chunks to local storage.
-            • chunk
-                usage: iterated response fragment written incrementally and used to advance progress.
             • error
                 usage: captured failure details displayed when download attempts do not succeed.
         Functions:
-            self.request_headers - supplies consistent request headers for authenticated download requests.
+            self.new_progress - builds the progress display when no shared one is supplied.
+            _iter_body - reads the response body straight from the connection when it is not compressed.
+            _write_behind - hands response chunks to a writer thread so disk writes overlap network reads.
 
         Streams a remote file to disk with progress reporting and returns whether the operation completed successfully.
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 url,
                 stream=True,
-                headers=self.request_headers(),
                 cookies=cookies,
                 timeout=self.timeout,
             )
@@ -97,19 +417,16 @@ class DownloadService:
 
             total_size = int(response.headers.get("content-length", 0))
 
-            with Progress(
-                TextColumn("[bold blue]{task.description}"),
-                BarColumn(),
-                DownloadColumn(),
-                TransferSpeedColumn(),
-            ) as progress:
+            display = nullcontext(progress) if progress is not None else self.new_progress()
+            with display as progress:
                 task = progress.add_task(description, total=total_size)
 
-                with open(dest_path, "wb") as file:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            file.write(chunk)
-                            progress.update(task, advance=len(chunk))
+                with open(dest_path, "wb", buffering=_WRITE_BUFFER_BYTES) as file:
+                    _write_behind(
+                        _iter_body(response, self.chunk_size),
+                        file,
+                        lambda size: progress.update(task, advance=size),
+                    )
 
             self.console.print(f"[green]✓ Successfully downloaded: {dest_path}[/green]")
             return True
@@ -118,11 +435,210 @@ class DownloadService:
             self.console.print(f"[red]Failed to download: {error}[/red]")
             return False
 
+    def download_file_ranged(
+        self,
+        url: str,
+        dest_path: str,
+        description: str = "Downloading",
+        cookies: dict | None = None,
+        parts: int = 4,
+        progress: Progress | None = None,
+    ) -> bool:
+        """
+        Variables:
+            • url
+                usage: direct media endpoint downloaded as several concurrent byte ranges.
+            • dest_path
+                usage: local destination file path that receives the finished download.
+            • part_path
+                usage: sibling temporary file preallocated and filled in place by each range, renamed to dest_path only once every range has finished.
+            • description
+                usage: progress-task label shown in the terminal while downloading.
+            • cookies
+                usage: authenticated cookie jar forwarded with every range request.
+            • parts
+                usage: number of connections fetching byte ranges concurrently over the pooled session.
+            • progress
+                usage: optional shared progress display; a private one is opened when none is supplied.
+            • total_size
+                usage: full file size reported by the server, or None when ranges are not supported.
+            • step
+                usage: byte length of each range, capped so a slow connection never holds a large share of the file.
+            • ranges
+                usage: inclusive start and end offsets covering the whole file without gaps, handed out to workers as they free up.
+            • display
+                usage: context manager that renders combined download progress for all ranges, or leaves a shared display untouched.
+            • task
+                usage: progress task handle advanced by every range worker.
+            • file
+                usage: output stream used to size the destination file before the ranges are written.
+            • executor
+                usage: thread pool that runs one worker per byte range.
+            • futures
+                usage: pending range jobs whose results surface any worker failure; queued ones are cancelled after a failure.
+            • future
+                usage: iterated range job awaited so errors are raised on the calling thread.
+            • error
+                usage: captured failure details displayed when download attempts do not succeed.
+        Functions:
+            self._probe_ranged_size - asks the server for the file size and confirms it honours range requests.
+            self.new_progress - builds the progress display when no shared one is supplied.
+            self._download_range - streams one byte range into its slice of the destination file.
+            self.download_file - single-stream fallback for small files or servers without range support.
+
+        Downloads a large file as several concurrent byte ranges written in place, which fills long-latency links that one TCP stream cannot; small files and servers without range support use the single-stream path.
+        """
+        try:
+            total_size = self._probe_ranged_size(url, cookies)
+        except requests.RequestException:
+            total_size = None
+        if parts <= 1 or total_size is None or total_size < _RANGED_MIN_BYTES:
+            return self.download_file(
+                url, dest_path, description=description, cookies=cookies, progress=progress
+            )
+
+        step = min(_RANGE_MAX_BYTES, -(-total_size // parts))
+        ranges = [
+            (start, min(start + step, total_size) - 1) for start in range(0, total_size, step)
+        ]
+        part_path = f"{dest_path}.part"
+
+        try:
+            display = nullcontext(progress) if progress is not None else self.new_progress()
+            with display as progress:
+                task = progress.add_task(description, total=total_size)
+
+                with open(part_path, "wb") as file:
+                    file.truncate(total_size)
+
+                with ThreadPoolExecutor(max_workers=parts) as executor:
+                    futures = [
+                        executor.submit(
+                            self._download_range,
+                            url,
+                            part_path,
+                            start,
+                            end,
+                            cookies,
+                            progress,
+                            task,
+                        )
+                        for start, end in ranges
+                    ]
+                    try:
+                        for future in futures:
+                            future.result()
+                    except BaseException:
+                        # Stop queued ranges from starting once the download has failed.
+                        for future in futures:
+                            future.cancel()
+                        raise
+
+            os.replace(part_path, dest_path)
+            self.console.print(f"[green]✓ Successfully downloaded: {dest_path}[/green]")
+            return True
+
+        except Exception as error:
+            # A preallocated file with unfilled ranges would pass for a finished video.
+            Path(part_path).unlink(missing_ok=True)
+            self.console.print(f"[red]Failed to download: {error}[/red]")
+            return False
+
+    def _probe_ranged_size(self, url: str, cookies: dict | None) -> int | None:
+        """
+        Variables:
+            • url
+                usage: media endpoint probed with a one-byte range request.
+            • cookies
+                usage: authenticated cookie jar forwarded with the probe.
+            • response
+                usage: probe response whose status and Content-Range header reveal range support and size.
+            • match
+                usage: parsed total-size suffix of the Content-Range header.
+
+        Requests the first byte of the file and returns the total size when the server answers with a partial response, or None when it ignores ranges.
+        """
+        with self.session.get(
+            url,
+            stream=True,
+            headers={"Range": "bytes=0-0"},
+            cookies=cookies,
+            timeout=self.timeout,
+        ) as response:
+            response.raise_for_status()
+            if response.status_code != 206:
+                return None
+            match = _CONTENT_RANGE_TOTAL_RE.search(response.headers.get("content-range", ""))
+            return int(match.group(1)) if match else None
+
+    def _download_range(
+        self,
+        url: str,
+        dest_path: str,
+        start: int,
+        end: int,
+        cookies: dict | None,
+        progress: Progress,
+        task,
+    ) -> None:
+        """
+        Variables:
+            • url
+                usage: media endpoint requested for one byte range.
+            • dest_path
+                usage: preallocated destination file written at this range's offset.
+            • start
+                usage: first byte offset of the range, also the file position where writing begins.
+            • end
+                usage: last byte offset of the range, inclusive.
+            • cookies
+                usage: authenticated cookie jar forwarded with the range request.
+            • progress
+                usage: shared progress display advanced as bytes arrive.
+            • task
+                usage: shared progress task handle for the whole file.
+            • response
+                usage: streamed partial response carrying this range's bytes.
+            • file
+                usage: private file handle positioned at the range start so workers never share a file offset.
+        Functions:
+            _iter_body - reads the response body straight from the connection when it is not compressed.
+            _write_behind - hands response chunks to a writer thread so disk writes overlap network reads.
+
+        Streams one byte range into its slice of the destination file through its own file handle.
+        """
+        with self.session.get(
+            url,
+            stream=True,
+            headers={"Range": f"bytes={start}-{end}"},
+            cookies=cookies,
+            timeout=self.timeout,
+        ) as response:
+            response.raise_for_status()
+            if response.status_code != 206:
+                raise requests.HTTPError(
+                    f"Server ignored range request (status {response.status_code})",
+                    response=response,
+                )
+
+            # Each range writes through its own handle on a writer thread in 1 MiB
+            # calls, so a multi-GB file costs a few thousand write(2) calls spread
+            # across threads; batching them through an io_uring ring would not
+            # change download time, which is bound by the network.
+            with open(dest_path, "r+b", buffering=_WRITE_BUFFER_BYTES) as file:
+                file.seek(start)
+                _write_behind(
+                    _iter_body(response, self.chunk_size),
+                    file,
+                    lambda size: progress.update(task, advance=size),
+                )
+
     def fetch_text(
         self,
         url: str,
         cookies: dict | None = None,
         description: str = "Fetching text",
+        show_status: bool = True,
     ) -> str | None:
         """
         Variables:
@@ -132,32 +648,306 @@ class DownloadService:
                 usage: authenticated cookie jar forwarded with transcript fetch requests.
             • description
                 usage: status label displayed while the text request is in progress.
+            • show_status
+                usage: flag that disables the spinner when another live display (such as a download progress bar) is already active.
+            • status
+                usage: spinner context shown while fetching, or a no-op context when the spinner is disabled.
             • response
                 usage: network response containing transcript payload and encoding metadata.
             • error
                 usage: captured failure details displayed when text retrieval fails.
+            • cached
+                usage: previously fetched payload served from the text cache, when fresh.
+            • text
+                usage: decoded response body returned to the caller and stored in the text cache.
         Functions:
-            self.request_headers - supplies consistent request headers for authenticated transcript requests.
+            self.text_cache.read - returns a fresh cached payload for the URL, if any.
+            self.text_cache.write - caches the fetched payload for later calls.
 
-        Fetches text payloads such as transcripts with status feedback and returns the response text when successful.
+        Fetches text payloads such as transcripts with status feedback and returns the response text when successful, answering repeated requests from the text cache when one is configured.
         """
+        if self.text_cache is not None:
+            cached = self.text_cache.read(url)
+            if cached is not None:
+                return cached
+
+        status = (
+            self.console.status(f"[cyan]{description}...[/cyan]", spinner="dots")
+            if show_status
+            else nullcontext()
+        )
         try:
-            with self.console.status(f"[cyan]{description}...[/cyan]", spinner="dots"):
-                response = requests.get(
+            with status:
+                response = self.session.get(
                     url,
-                    headers=self.request_headers(),
                     cookies=cookies,
                     timeout=self.timeout,
                 )
                 response.raise_for_status()
-                response.encoding = response.encoding or "utf-8"
-                return response.text
+                response.encoding = _text_encoding(response)
+                text = response.text
         except Exception as error:
             self.console.print(f"[red]Failed to fetch text: {error}[/red]")
             return None
 
+        if self.text_cache is not None:
+            try:
+                self.text_cache.write(url, text)
+            except OSError as error:
+                # A cache that cannot be written only costs a refetch next time.
+                self.console.print(f"[dim]Transcript not cached: {error}[/dim]")
+        return text
+
+    def iter_text(
+        self,
+        url: str,
+        cookies: dict | None = None,
+        chunk_size: int = 64 * 1024,
+    ) -> Iterator[str]:
+        """
+        Variables:
+            • url
+                usage: text endpoint, such as a transcript URL, streamed incrementally.
+            • cookies
+                usage: authenticated cookie jar forwarded with the streamed request.
+            • chunk_size
+                usage: number of bytes read from the connection per decoded fragment.
+            • cached
+                usage: previously fetched payload served from the text cache, when fresh.
+        Functions:
+            self.text_cache.read - returns a fresh cached payload for the URL, if any, without pinning it in memory.
+            self.text_cache.write_through - caches the fetched stream on disk while passing it on; a cache that cannot be written is logged and skipped.
+            self._stream_text - streams the payload from the network.
+
+        Yields decoded text fragments from a remote payload without buffering the whole body, serving and refreshing the text cache when one is configured; request and HTTP errors propagate to the caller.
+        """
+        if self.text_cache is None:
+            yield from self._stream_text(url, cookies, chunk_size)
+            return
+
+        cached = self.text_cache.read(url, remember=False)
+        if cached is not None:
+            yield cached
+            return
+        yield from self.text_cache.write_through(
+            url,
+            self._stream_text(url, cookies, chunk_size),
+            on_error=lambda error: self.console.print(f"[dim]Transcript not cached: {error}[/dim]"),
+        )
+
+    def _stream_text(self, url: str, cookies: dict | None, chunk_size: int) -> Iterator[str]:
+        """
+        Variables:
+            • url
+                usage: text endpoint streamed incrementally.
+            • cookies
+                usage: authenticated cookie jar forwarded with the streamed request.
+            • chunk_size
+                usage: number of bytes read from the connection per decoded fragment.
+            • response
+                usage: streamed network response whose body is decoded and yielded piece by piece.
+
+        Yields decoded text fragments straight from the network response.
+        """
+        with self.session.get(
+            url,
+            stream=True,
+            cookies=cookies,
+            timeout=self.timeout,
+        ) as response:
+            response.raise_for_status()
+            response.encoding = _text_encoding(response)
+            yield from response.iter_content(chunk_size=chunk_size, decode_unicode=True)
+
+    def iter_bytes(
+        self,
+        url: str,
+        cookies: dict | None = None,
+        chunk_size: int = 64 * 1024,
+    ) -> Iterator[bytes]:
+        """
+        Variables:
+            • url
+                usage: endpoint, such as a transcript URL, whose body is saved byte for byte.
+            • cookies
+                usage: authenticated cookie jar forwarded with the streamed request.
+            • chunk_size
+                usage: number of bytes read from the connection per fragment.
+            • response
+                usage: streamed network response whose undecoded body is yielded.
+        Functions:
+            _iter_body - reads the body fragments, undoing only transfer compression.
+
+        Yields the raw response body without any text decoding, for files that must be stored exactly as served; request and HTTP errors propagate to the caller.
+        """
+        with self.session.get(
+            url,
+            stream=True,
+            cookies=cookies,
+            timeout=self.timeout,
+        ) as response:
+            response.raise_for_status()
+            yield from _iter_body(response, chunk_size)
+
+
+def _text_encoding(response: requests.Response) -> str:
+    """
+    Variables:
+        • response
+            usage: text response whose declared charset is checked.
+
+    Returns the charset the server declared, or UTF-8 when it declared none; requests would otherwise fall back to ISO-8859-1 for text/* types such as Zoom's text/vtt and garble every non-ASCII caption.
+    """
+    if "charset=" in response.headers.get("content-type", "").lower():
+        return response.encoding or "utf-8"
+    return "utf-8"
+
+
+def _iter_body(response: requests.Response, chunk_size: int) -> Iterator[bytes]:
+    """
+    Variables:
+        • response
+            usage: streamed response whose body is read.
+        • chunk_size
+            usage: bytes requested per read.
+        • encoding
+            usage: Content-Encoding header value deciding whether decompression is needed.
+        • read
+            usage: bound raw-socket read method called in a tight loop.
+
+    Returns an iterator over the response body that reads the raw connection directly when the body is not content-encoded, skipping iter_content's generator and decode checks; compressed bodies still go through iter_content so they are decoded.
+    """
+    encoding = response.headers.get("content-encoding", "identity").strip().lower()
+    if encoding not in ("", "identity"):
+        return response.iter_content(chunk_size=chunk_size)
+    read = response.raw.read
+    return iter(lambda: read(chunk_size, decode_content=False), b"")
+
+
+def _write_behind(
+    chunks: Iterable[bytes],
+    file,
+    on_chunk: Callable[[int], None] | None = None,
+) -> None:
+    """
+    Variables:
+        • chunks
+            usage: response fragments read from the network on the calling thread.
+        • file
+            usage: open binary file handle written only by the writer thread.
+        • released
+            usage: file offset up to which written pages were already released from the page cache; starts where this stream begins writing.
+        • on_chunk
+            usage: optional callback given the number of bytes received, used to advance progress.
+        • buffer
+            usage: bounded queue handing fragments to the writer; a None sentinel marks the end of the stream.
+        • errors
+            usage: any exception captured on the writer thread and re-raised on the calling thread.
+        • writer
+            usage: background thread that drains the queue into the file.
+        • chunk
+            usage: iterated response fragment queued for writing.
+        • unreleased
+            usage: bytes written since the last page-cache release, checked against the release step.
+        • unreported
+            usage: bytes received but not yet passed to on_chunk, flushed once they reach the progress step.
+    Functions:
+        _advise_sequential - tells the kernel the file is written front to back.
+        _release_cache - starts writeback and drops already-written pages from the page cache.
+
+    Writes a chunk stream to a file on a background thread so a slow disk write never stalls the next network read; the bounded queue caps buffered memory and the caller sees any write error once the stream ends.
+    """
+    _advise_sequential(file)
+    released = file.tell()
+    buffer: queue.Queue[bytes | None] = queue.Queue(maxsize=_WRITE_QUEUE_DEPTH)
+    errors: list[BaseException] = []
+
+    def drain() -> None:
+        nonlocal released
+        unreleased = 0
+        chunk: bytes | None = b""
+        try:
+            while (chunk := buffer.get()) is not None:
+                file.write(chunk)
+                unreleased += len(chunk)
+                if unreleased >= _CACHE_RELEASE_BYTES:
+                    released = _release_cache(file, released)
+                    unreleased = 0
+            _release_cache(file, released)
+        except BaseException as error:
+            # Any failure, not just OSError, must leave the thread draining: a dead
+            # writer would block the reader on a full queue forever.
+            errors.append(error)
+            if chunk is not None:
+                while buffer.get() is not None:
+                    pass
+
+    writer = threading.Thread(target=drain, name="download-writer", daemon=True)
+    writer.start()
+    unreported = 0
+    try:
+        for chunk in chunks:
+            if errors:
+                break
+            if chunk:
+                buffer.put(chunk)
+                unreported += len(chunk)
+                if on_chunk is not None and unreported >= _PROGRESS_STEP_BYTES:
+                    on_chunk(unreported)
+                    unreported = 0
+        if on_chunk is not None and unreported:
+            on_chunk(unreported)
+    finally:
+        buffer.put(None)
+        writer.join()
+
+    if errors:
+        raise errors[0]
+
+
+def _advise_sequential(file) -> None:
+    """
+    Variables:
+        • file
+            usage: open file handle whose descriptor receives the access-pattern hint.
+
+    Hints sequential access for the file so the kernel tunes readahead and page-cache reclaim for streaming; a no-op where posix_fadvise is unavailable or the handle has no descriptor.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    except (OSError, AttributeError, ValueError):
+        # The hint is advisory; filesystems that reject it still write correctly.
+        pass
+
+
+def _release_cache(file, start: int) -> int:
+    """
+    Variables:
+        • file
+            usage: open binary file handle flushed before its written pages are released.
+        • start
+            usage: offset up to which earlier calls already released the file, so only new pages are advised.
+        • end
+            usage: current write offset, the end of the released region.
+
+    Flushes buffered data, advises the kernel that the region written since start will not be read again soon, and returns the offset to pass as start next time; Linux starts writeback for dirty pages and drops clean ones, so repeated calls keep the cache footprint bounded without re-advising the whole file. Returns start unchanged where posix_fadvise is unavailable or the hint fails.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return start
+    try:
+        file.flush()
+        end = file.tell()
+        os.posix_fadvise(file.fileno(), start, end - start, os.POSIX_FADV_DONTNEED)
+    except (OSError, AttributeError, ValueError):
+        # The hint is advisory; filesystems that reject it still write correctly.
+        return start
+    return end
+
 
 DEFAULT_DOWNLOAD_SERVICE = DownloadService()
+atexit.register(DEFAULT_DOWNLOAD_SERVICE.close)
 
 
 def download_file(url, dest_path, description="Downloading", cookies=None):
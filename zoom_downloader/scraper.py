@@ -8,12 +8,56 @@ Design note:
 """
 
 import json
+import queue
 import re
+import threading
 import time
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 
 from rich.console import Console
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_VIDEO_URL_KEYS = ("viewMp4Url", "mp4Url", "downloadUrl", "play_url", "fileUrl")
+_TRANSCRIPT_URL_KEYS = (
+    "viewVttUrl",
+    "vttUrl",
+    "closedCaptionUrl",
+    "transcriptUrl",
+    "subtitleUrl",
+    "chatFileUrl",
+)
+# Matches "key": "value" pairs for the transcript keys inside JSON embedded in page HTML.
+_EMBEDDED_TRANSCRIPT_RE = re.compile(
+    r'"(?:' + "|".join(_TRANSCRIPT_URL_KEYS) + r')"\s*:\s*"([^"]+)"'
+)
+_URL_RE = re.compile(r'https?://[^\s"\'<>\\]+')
+_ZOOM_SUFFIX_RE = re.compile(r"_*-_*Zoom$", re.IGNORECASE)
+_EMBEDDED_TOPIC_RE = re.compile(r'"topic"\s*:\s*"([^"]+)"')
+_HTML_TITLE_RE = re.compile(r"<title[^>]*>([^<]*)</title>", re.IGNORECASE)
+# Relative links in recording payloads resolve against this origin.
+_ZOOM_ORIGIN = "https://www.zoom.us"
+_TITLE_TRANSLATION = str.maketrans({"/": "-", ":": "-", " ": "_"})
+# Zoom-owned hosts: recording URLs given to the CLI must match, and JSON responses
+# from anywhere else (analytics, telemetry) are never read.
+ZOOM_URL_RE = re.compile(
+    r"^https?://(?:[a-z0-9-]+\.)*(?:zoom\.us|zoom\.com|zoomgov\.com)(?::\d+)?(?:[/?#]|$)",
+    re.IGNORECASE,
+)
+# Larger JSON bodies from other endpoints are not recording metadata, so they are not
+# pulled from the browser.
+_MAX_FALLBACK_BODY_BYTES = 4 * 1024 * 1024
+
+# Longest single wait while polling, so a found URL is noticed within this delay.
+_EVENT_PUMP_SECONDS = 0.25
+# Extra time allowed for the transcript response once the video URL is known.
+_TRANSCRIPT_GRACE_SECONDS = 2.0
+_STATUS_INTERVAL_SECONDS = 15.0
+
 
 @dataclass
 class MediaInfo:
@@ -60,7 +104,7 @@ class ZoomMediaScraper:
     - console
       usage: terminal logger for progress and extraction summary.
     - poll_interval
-      usage: delay (seconds) between polling iterations while waiting for media data.
+      usage: length (seconds) of each polling iteration while waiting for media data; events are still handled as they arrive.
     - max_wait_seconds
       usage: upper bound for polling while user completes login/2FA.
     """
@@ -68,7 +112,7 @@ class ZoomMediaScraper:
     def __init__(
         self,
         console_instance: Console | None = None,
-        poll_interval: int = 3,
+        poll_interval: float = 3.0,
         max_wait_seconds: int = 300,
     ):
         """
@@ -95,7 +139,7 @@ class ZoomMediaScraper:
 
         Extracts all HTTP and HTTPS URL candidates from arbitrary text content.
         """
-        return re.findall(r'https?://[^\s"\'<>\\]+', text)
+        return _URL_RE.findall(text)
 
     @staticmethod
     def _normalize_url(url: str | None) -> str | None:
@@ -108,8 +152,8 @@ class ZoomMediaScraper:
         """
         if not url:
             return url
-        if url.startswith("/"):
-            return "https://www.zoom.us" + url
+        if url[0] == "/":
+            return _ZOOM_ORIGIN + url
         return url
 
     @staticmethod
@@ -119,9 +163,27 @@ class ZoomMediaScraper:
             • raw
                 usage: unsanitized title text derived from meeting metadata or page title.
 
-        Normalizes title text so it can be safely used as a filesystem-friendly output name.
+        Normalizes title text so it can be safely used as a filesystem-friendly output name, mapping slashes and colons to dashes and spaces to underscores in one pass.
+        """
+        return raw.translate(_TITLE_TRANSLATION).strip()
+
+    def _clean_page_title(self, raw_title: str) -> str | None:
+        """
+        Variables:
+            • raw_title
+                usage: browser or HTML page title used as a fallback naming source.
+            • clean
+                usage: sanitized title with the trailing Zoom suffix removed.
+        Functions:
+            self._sanitize_title - normalizes the page title into a filesystem-safe value.
+
+        Turns a recording page title into an output name, or returns None when the title is empty or belongs to a sign-in page.
         """
-        return raw.replace("/", "-").replace(":", "-").replace(" ", "_").strip()
+        clean = self._sanitize_title(raw_title)
+        clean = _ZOOM_SUFFIX_RE.sub("", clean).strip("_- ")
+        if clean and "sign" not in clean.lower():
+            return clean
+        return None
 
     def _capture_from_recording_api(self, body: str, media_info: MediaInfo) -> None:
         """
@@ -131,7 +193,7 @@ class ZoomMediaScraper:
             • media_info
                 usage: mutable result container updated with discovered media URLs and metadata fields.
             • data
-                usage: parsed JSON content used to inspect recording fields.
+                usage: parsed JSON content used to inspect recording fields, decoded with orjson when it is installed.
             • result
                 usage: normalized payload section containing recording links and metadata.
             • key
@@ -151,31 +213,25 @@ class ZoomMediaScraper:
             • start_str
                 usage: meeting start-time label used to enrich extracted metadata.
         Functions:
+            _loads_payload - decodes the response body, preferring orjson over the stdlib parser.
             self._normalize_url - converts extracted URLs into absolute URLs before storing them.
             self._sanitize_title - turns meeting topic text into a filesystem-safe title value.
 
         Parses Zoom recording API payloads to capture preferred media links and meeting metadata into the shared result object.
         """
         try:
-            data = json.loads(body)
+            data = _loads_payload(body)
             result = data.get("result", data)
         except (json.JSONDecodeError, AttributeError):
             return
 
-        for key in ("viewMp4Url", "mp4Url", "downloadUrl", "play_url", "fileUrl"):
+        for key in _VIDEO_URL_KEYS:
             val = result.get(key)
             if val and not media_info.video_url:
                 media_info.video_url = self._normalize_url(val)
                 break
 
-        for key in (
-            "viewVttUrl",
-            "vttUrl",
-            "closedCaptionUrl",
-            "transcriptUrl",
-            "subtitleUrl",
-            "chatFileUrl",
-        ):
+        for key in _TRANSCRIPT_URL_KEYS:
             val = result.get(key)
             if val and not media_info.transcript_url:
                 media_info.transcript_url = self._normalize_url(val)
@@ -206,34 +262,177 @@ class ZoomMediaScraper:
                 usage: JSON or text response body searched for URL patterns when structured extraction is insufficient.
             • media_info
                 usage: mutable result container updated with fallback-discovered video and transcript URLs.
+            • match
+                usage: regex match for each URL candidate, produced lazily so scanning can stop early.
             • found_url
                 usage: URL candidate extracted from body text and evaluated against media heuristics.
             • low
                 usage: lowercase URL form used for case-insensitive matching against media indicators.
+
+        Applies heuristic URL matching on generic payload text to fill missing media links when API-specific keys are unavailable; the body is scanned in one pass that stops as soon as both links are known, and not at all when they already are.
+        """
+        if media_info.video_url and media_info.transcript_url:
+            return
+
+        for match in _URL_RE.finditer(body):
+            found_url = match.group(0)
+            low = found_url.lower()
+            if (
+                not media_info.video_url
+                and (".mp4" in low or "ssrweb" in low)
+                and "thumbnail" not in low
+                and "avatar" not in low
+            ):
+                media_info.video_url = found_url
+            if not media_info.transcript_url and (".vtt" in low or "closedcaption" in low):
+                media_info.transcript_url = found_url
+            if media_info.video_url and media_info.transcript_url:
+                break
+
+    @staticmethod
+    def _pump_events(page, seconds: float, done) -> bool:
+        """
+        Variables:
+            • page
+                usage: browser tab whose wait calls let Playwright deliver pending response events.
+            • seconds
+                usage: maximum time to wait.
+            • done
+                usage: callable checked between short waits; waiting stops as soon as it returns a truthy value.
+            • deadline
+                usage: monotonic time at which waiting gives up.
+            • remaining
+                usage: time left before the deadline, used to size the final wait step.
+
+        Waits up to the given time while letting Playwright dispatch page events, returning early once done() is satisfied; returns False when the page is gone (for example, the user closed the window).
+        """
+        from playwright.sync_api import Error as PlaywrightError
+
+        deadline = time.monotonic() + seconds
+        while not done() and (remaining := deadline - time.monotonic()) > 0:
+            try:
+                page.wait_for_timeout(min(remaining, _EVENT_PUMP_SECONDS) * 1000)
+            except PlaywrightError:
+                return False
+        return True
+
+    def _capture_response(
+        self,
+        response_url: str,
+        resp_url: str,
+        content_type: str,
+        body: str | None,
+        media_info: MediaInfo,
+    ) -> None:
+        """
+        Variables:
+            • response_url
+                usage: URL of the intercepted response, stored as-is when it points at media directly.
+            • resp_url
+                usage: lowercase response URL, computed once by the response handler, used for endpoint and file-extension checks.
+            • content_type
+                usage: response content-type header used to decide JSON parsing versus direct media handling.
+            • body
+                usage: response body text for candidate JSON responses, or None when it was not read.
+            • media_info
+                usage: mutable result container updated with discovered media URLs and metadata.
         Functions:
-            self._find_urls_in_text - scans payload text and returns URL candidates for fallback filtering.
+            self._capture_from_recording_api - extracts media URLs and metadata from known recording API payloads.
+            self._capture_from_json_fallback - attempts heuristic URL extraction from generic JSON payloads.
 
-        Applies heuristic URL matching on generic payload text to fill missing media links when API-specific keys are unavailable.
+        Classifies one intercepted response and fills any still-missing media URLs from its URL, content type, or body; each check is skipped once its slot is filled.
         """
-        if not media_info.video_url:
-            for found_url in self._find_urls_in_text(body):
-                low = found_url.lower()
-                if (
-                    (".mp4" in low or "ssrweb" in low)
-                    and "thumbnail" not in low
-                    and "avatar" not in low
-                ):
-                    media_info.video_url = found_url
-                    break
+        if (
+            not media_info.video_url
+            and ".mp4" in resp_url
+            and "thumbnail" not in resp_url
+            and "avatar" not in resp_url
+        ):
+            media_info.video_url = response_url
 
+        if not media_info.transcript_url and ".vtt" in resp_url:
+            media_info.transcript_url = response_url
+
+        if body is not None and "json" in content_type:
+            if _is_recording_api(resp_url):
+                self.console.print("[cyan]Intercepted Zoom recording API response.[/cyan]")
+                self._capture_from_recording_api(body, media_info)
+            self._capture_from_json_fallback(body, media_info)
+
+        if not media_info.video_url and "video/" in content_type:
+            media_info.video_url = response_url
+
+    def extract_transcript_info_fast(
+        self, url: str, session, cookies=None
+    ) -> dict[str, str | None] | None:
+        """
+        Variables:
+            • url
+                usage: recording-page URL fetched directly over HTTP.
+            • session
+                usage: HTTP session used to fetch the page with the saved authentication cookies.
+            • cookies
+                usage: cookie jar loaded from the saved browser session.
+            • response
+                usage: HTTP response for the recording page.
+            • body
+                usage: page HTML with JSON-escaped slashes restored so embedded URLs can be matched.
+            • media_info
+                usage: result object filled with the transcript URL and title found in the page.
+            • match
+                usage: regex match for an embedded transcript URL, topic, or HTML title.
+            • topic
+                usage: meeting topic text decoded from the embedded page data.
+            • clean
+                usage: sanitized HTML title used when no topic is embedded.
+            • error
+                usage: request failure that sends the caller back to the browser-based extraction.
+        Functions:
+            session.get - fetches the page over HTTP without launching a browser.
+            self._normalize_url - converts relative transcript paths into absolute URLs.
+            self._capture_from_json_fallback - applies heuristic URL matching when no known key is embedded.
+            self._sanitize_title - turns the meeting topic into a filesystem-safe title value.
+            self._clean_page_title - derives a title from the HTML title tag as a fallback.
+            media_info.to_dict - converts the populated result into a plain dictionary for callers.
+
+        Looks for the transcript URL in the recording page's server-rendered HTML using saved cookies, so transcript-only runs can skip the browser; returns None when the page does not expose one (for example when the session has expired) so the caller can fall back to extract_media_info.
+        """
+        try:
+            response = session.get(url, cookies=cookies, timeout=30)
+            response.raise_for_status()
+        except Exception as error:
+            self.console.print(f"[dim]Direct page fetch skipped: {error}[/dim]")
+            return None
+
+        body = response.text.replace("\\/", "/")
+        media_info = MediaInfo()
+
+        match = _EMBEDDED_TRANSCRIPT_RE.search(body)
+        if match:
+            media_info.transcript_url = self._normalize_url(_decode_json_string(match.group(1)))
+        else:
+            self._capture_from_json_fallback(body, media_info)
         if not media_info.transcript_url:
-            for found_url in self._find_urls_in_text(body):
-                low = found_url.lower()
-                if ".vtt" in low or "closedcaption" in low:
-                    media_info.transcript_url = found_url
-                    break
+            return None
+
+        match = _EMBEDDED_TOPIC_RE.search(body)
+        if match:
+            topic = _decode_json_string(match.group(1))
+            media_info.topic = topic
+            media_info.title = self._sanitize_title(topic)
+        else:
+            match = _HTML_TITLE_RE.search(body)
+            clean = self._clean_page_title(match.group(1).strip()) if match else None
+            if clean:
+                media_info.title = clean
+
+        # Only the transcript is needed on this path; a video URL found by the
+        # heuristic scan is dropped so callers never download from a guessed link.
+        media_info.video_url = None
+        self.console.print("[green]✓ Transcript URL found (without opening the browser)[/green]")
+        return media_info.to_dict()
 
-    def extract_media_info(self, context, url: str) -> dict[str, str | None]:
+    def extract_media_info(self, context, url: str, page=None) -> dict[str, str | None]:
         """
         Variables:
             • context
@@ -241,11 +440,27 @@ class ZoomMediaScraper:
             • url
                 usage: recording-page URL navigated to for media extraction.
             • page
-                usage: browser tab used for response interception, fallback DOM probing, and title collection.
+                usage: browser tab used for response interception, fallback DOM probing, and title collection; a new one is opened and closed when none is given.
+            • owns_page
+                usage: whether this call opened the tab and must close it.
             • media_info
                 usage: mutable extraction result object that accumulates URLs and metadata through all strategies.
+            • video_ready
+                usage: event set by the capture worker as soon as a video URL is captured, ending the wait.
+            • transcript_ready
+                usage: event set by the capture worker once a transcript URL is captured, ending the grace wait early.
+            • topic_ready
+                usage: event set by the capture worker once the meeting topic is captured.
+            • captures
+                usage: queue of intercepted responses handed from the Playwright thread to the capture worker.
+            • worker
+                usage: background thread that parses queued responses into the shared media result object.
+            • started
+                usage: monotonic time when polling began, used to enforce the maximum wait duration.
             • elapsed
-                usage: elapsed polling time counter used to enforce maximum wait duration.
+                usage: seconds spent polling so far.
+            • next_status
+                usage: elapsed time at which the next waiting message is printed.
             • selector
                 usage: fallback CSS selector iterated while probing for direct video source elements.
             • element
@@ -263,67 +478,103 @@ class ZoomMediaScraper:
             • error
                 usage: captured navigation error details reported as non-fatal status output.
         Functions:
-            handle_response - processes each network response and captures media URLs from payloads and headers.
-            self._capture_from_recording_api - extracts canonical URLs and metadata from recording API responses.
-            self._capture_from_json_fallback - applies heuristic extraction for generic JSON payloads.
-            self._sanitize_title - normalizes page titles when used as fallback output names.
+            handle_response - reads each network response on the Playwright thread and queues it for parsing.
+            capture_responses - parses queued responses and captures media URLs from payloads and headers.
+            self._pump_events - waits while letting Playwright deliver response events, stopping early once URLs are found.
+            self._clean_page_title - normalizes page titles when used as fallback output names.
             media_info.to_dict - converts the populated media result object into a plain dictionary for callers.
 
         Opens the recording page, captures media URLs via network interception, applies DOM and title fallbacks, and returns normalized recording metadata.
         """
-        page = context.new_page()
+        from playwright.sync_api import Error as PlaywrightError
+
+        owns_page = page is None
+        if owns_page:
+            page = context.new_page()
         media_info = MediaInfo()
+        video_ready = threading.Event()
+        transcript_ready = threading.Event()
+        topic_ready = threading.Event()
+
+        captures: queue.Queue[tuple[str, str, str, str | None] | None] = queue.Queue()
 
         def handle_response(response):
             """
             Variables:
                 • response
-                    usage: network response inspected for direct media links and JSON payload data.
+                    usage: network response whose URL, content type, and candidate body are handed to the capture worker.
                 • resp_url
-                    usage: lowercase response URL used for endpoint and file-extension checks.
+                    usage: lowercase response URL used for endpoint checks and passed on so the worker does not lowercase it again.
                 • content_type
-                    usage: response content-type header used to decide JSON parsing versus direct media handling.
+                    usage: response content-type header used to decide whether the body is worth reading.
+                • content_length
+                    usage: declared body size, used to skip reading oversized JSON from unrelated endpoints.
                 • body
-                    usage: response body text parsed when JSON-based extraction logic is needed.
-            Functions:
-                self._capture_from_recording_api - extracts media URLs and metadata from known recording API payloads.
-                self._capture_from_json_fallback - attempts heuristic URL extraction from generic JSON payloads.
+                    usage: response body text read for candidate JSON responses, or None when it is not needed.
 
-            Inspects each intercepted response and updates the shared media result object as soon as relevant media URLs are discovered.
+            Reads what the capture worker needs from each intercepted response and queues it; reading must stay on the Playwright thread, while parsing happens on the worker so it never delays the next response event. Progress is read only from the worker's ready events, never from the media result object it is writing; once both URLs and the topic are known, the handler unregisters itself so later traffic is not even dispatched, while anything already queued is still drained by the worker.
             """
+            if video_ready.is_set() and transcript_ready.is_set() and topic_ready.is_set():
+                try:
+                    page.remove_listener("response", handle_response)
+                except (PlaywrightError, KeyError):
+                    # KeyError: the handler was already removed.
+                    pass
+                return
+
             try:
                 resp_url = response.url.lower()
                 content_type = response.headers.get("content-type", "")
+                content_length = response.headers.get("content-length") or 0
+                body = None
+
+                # Reading a body is a round trip to the browser, so other JSON is only
+                # fetched while a URL is still missing and it could plausibly hold one.
+                if "json" in content_type and (
+                    _is_recording_api(resp_url)
+                    or not (
+                        (video_ready.is_set() and transcript_ready.is_set())
+                        or not ZOOM_URL_RE.match(resp_url)
+                        or int(content_length) > _MAX_FALLBACK_BODY_BYTES
+                    )
+                ):
+                    try:
+                        body = response.text()
+                    except PlaywrightError:
+                        # Redirects and evicted responses have no body to read.
+                        body = None
+
+                captures.put((response.url, resp_url, content_type, body))
+            except (PlaywrightError, ValueError):
+                # ValueError: a malformed content-length header.
+                return
 
-                if ".mp4" in resp_url and not media_info.video_url:
-                    if "thumbnail" not in resp_url and "avatar" not in resp_url:
-                        media_info.video_url = response.url
-
-                if ".vtt" in resp_url and not media_info.transcript_url:
-                    media_info.transcript_url = response.url
-
-                if "json" not in content_type:
-                    if "video/" in content_type and not media_info.video_url:
-                        media_info.video_url = response.url
-                    return
+        def capture_responses():
+            """
+            Variables:
+                • item
+                    usage: queued (URL, lowercase URL, content type, body) tuple for one response; None stops the worker.
+            Functions:
+                self._capture_response - updates the shared media result object from one response.
 
+            Applies queued responses in arrival order as the only writer of the shared media result object, and signals the matching ready events as soon as each URL is known.
+            """
+            while (item := captures.get()) is not None:
                 try:
-                    body = response.text()
+                    self._capture_response(*item, media_info)
                 except Exception:
-                    return
-
-                if "nws/recording" in resp_url or "play/info" in resp_url:
-                    self.console.print("[cyan]Intercepted Zoom recording API response.[/cyan]")
-                    self._capture_from_recording_api(body, media_info)
-
-                self._capture_from_json_fallback(body, media_info)
-
-                if "video/" in content_type and not media_info.video_url:
-                    media_info.video_url = response.url
-
-            except Exception:
-                return
-
+                    # Payloads are arbitrary JSON; one malformed response must not stop
+                    # the worker, or every later response would go unparsed.
+                    pass
+                if media_info.video_url:
+                    video_ready.set()
+                if media_info.transcript_url:
+                    transcript_ready.set()
+                if media_info.topic:
+                    topic_ready.set()
+
+        worker = threading.Thread(target=capture_responses, name="zoom-capture", daemon=True)
+        worker.start()
         page.on("response", handle_response)
 
         self.console.print("[cyan]Opening recording page...[/cyan]")
@@ -334,27 +585,43 @@ class ZoomMediaScraper:
 
         try:
             page.goto(url, timeout=60000)
-        except Exception as error:
+        except PlaywrightError as error:
             self.console.print(f"[yellow]Navigation note: {error}[/yellow]")
 
-        elapsed = 0
-        while elapsed < self.max_wait_seconds:
-            time.sleep(self.poll_interval)
-            elapsed += self.poll_interval
-
-            if media_info.video_url:
-                time.sleep(2)
+        # The sync Playwright API only dispatches response events while one of its own
+        # calls is running, so waiting goes through page.wait_for_timeout rather than
+        # time.sleep; handlers then fire as responses arrive instead of between sleeps.
+        started = time.monotonic()
+        next_status = _STATUS_INTERVAL_SECONDS
+        while (elapsed := time.monotonic() - started) < self.max_wait_seconds:
+            if video_ready.is_set():
+                self._pump_events(page, _TRANSCRIPT_GRACE_SECONDS, transcript_ready.is_set)
                 break
 
-            if elapsed % 15 == 0:
+            if elapsed >= next_status:
+                next_status += _STATUS_INTERVAL_SECONDS
                 try:
                     title = page.title()
                     self.console.print(
-                        f"[dim][{elapsed}s] Waiting for recording to load... "
+                        f"[dim][{int(elapsed)}s] Waiting for recording to load... "
                         f"(page: {title[:50]})[/dim]"
                     )
-                except Exception:
-                    self.console.print(f"[dim][{elapsed}s] Waiting (page navigating)...[/dim]")
+                except PlaywrightError:
+                    self.console.print(
+                        f"[dim][{int(elapsed)}s] Waiting (page navigating)...[/dim]"
+                    )
+
+            if not self._pump_events(page, self.poll_interval, video_ready.is_set):
+                break
+
+        # Stop intercepting before the DOM fallbacks and let the worker finish what was queued.
+        try:
+            page.remove_listener("response", handle_response)
+        except (PlaywrightError, KeyError):
+            # KeyError: the handler already removed itself.
+            pass
+        captures.put(None)
+        worker.join()
 
         if not media_info.video_url:
             for selector in ["video source", "video"]:
@@ -365,7 +632,7 @@ class ZoomMediaScraper:
                         if src and "blob:" not in src:
                             media_info.video_url = src
                             break
-                except Exception:
+                except PlaywrightError:
                     continue
 
         if not media_info.transcript_url:
@@ -375,21 +642,21 @@ class ZoomMediaScraper:
                     src = track.get_attribute("src")
                     if src:
                         media_info.transcript_url = src
-            except Exception:
+            except PlaywrightError:
                 pass
 
         if media_info.title == "Zoom_Recording":
             try:
                 raw_title = page.title()
                 if raw_title:
-                    clean = self._sanitize_title(raw_title)
-                    clean = re.sub(r"_*-_*Zoom$", "", clean, flags=re.IGNORECASE).strip("_- ")
-                    if clean and "sign" not in clean.lower():
+                    clean = self._clean_page_title(raw_title)
+                    if clean:
                         media_info.title = clean
-            except Exception:
+            except PlaywrightError:
                 pass
 
-        page.close()
+        if owns_page:
+            page.close()
 
         if media_info.video_url:
             self.console.print("[green]✓ Video URL found[/green]")
@@ -409,6 +676,84 @@ class ZoomMediaScraper:
 
         return media_info.to_dict()
 
+    def extract_many(
+        self, context, urls: Iterable[str]
+    ) -> Iterator[tuple[str, dict[str, str | None] | None]]:
+        """
+        Variables:
+            • context
+                usage: authenticated browser context shared by every scrape.
+            • urls
+                usage: recording-page URLs scraped one after another.
+            • page
+                usage: browser tab reused across recordings, reopened only if it was closed.
+            • url
+                usage: iterated recording-page URL.
+            • error
+                usage: scraping failure reported before moving on to the next recording.
+        Functions:
+            self.extract_media_info - scrapes one recording page in the shared tab.
+
+        Scrapes several recordings through one tab of one context, so Chromium's DNS, TLS sessions, and cache stay warm between pages; yields each URL with its metadata, or None when it could not be read. The tab is parked on about:blank between recordings so late responses from one page are never credited to the next.
+        """
+        from playwright.sync_api import Error as PlaywrightError
+
+        page = None
+        try:
+            for url in urls:
+                if page is None or page.is_closed():
+                    page = context.new_page()
+                try:
+                    yield url, self.extract_media_info(context, url, page=page)
+                except Exception as error:
+                    self.console.print(f"[red]Could not read {url}: {error}[/red]")
+                    yield url, None
+                try:
+                    page.goto("about:blank")
+                except PlaywrightError:
+                    pass
+        finally:
+            if page is not None and not page.is_closed():
+                page.close()
+
+
+def _is_recording_api(resp_url: str) -> bool:
+    """
+    Variables:
+        • resp_url
+            usage: lowercase response URL checked against the recording API endpoints.
+
+    Reports whether a response comes from a Zoom recording API endpoint, whose body is always inspected.
+    """
+    return "nws/recording" in resp_url or "play/info" in resp_url
+
+
+def _loads_payload(body: str):
+    """
+    Variables:
+        • body
+            usage: intercepted response text parsed into Python objects.
+
+    Parses a recording API payload, using orjson when it is installed; its decode error subclasses json.JSONDecodeError, so callers catch one type either way.
+    """
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def _decode_json_string(raw: str) -> str:
+    """
+    Variables:
+        • raw
+            usage: body of a JSON string literal matched in page HTML, possibly containing escapes.
+
+    Decodes JSON escapes such as \\u0026 in a string matched from embedded page data, returning the raw text when it is not valid JSON.
+    """
+    try:
+        return json.loads(f'"{raw}"')
+    except json.JSONDecodeError:
+        return raw
+
 
 DEFAULT_MEDIA_SCRAPER = ZoomMediaScraper()
 
@@ -426,6 +771,21 @@ def _find_urls_in_text(text):
     return DEFAULT_MEDIA_SCRAPER._find_urls_in_text(text)
 
 
+def extract_many(context, urls):
+    """
+    Variables:
+        • context
+            usage: authenticated browser context forwarded to the shared scraper.
+        • urls
+            usage: recording-page URLs forwarded to the shared scraper.
+    Functions:
+        DEFAULT_MEDIA_SCRAPER.extract_many - delegates batch extraction to the shared scraper instance.
+
+    Provides a module-level wrapper that scrapes several recordings through the shared scraper in one reused tab.
+    """
+    return DEFAULT_MEDIA_SCRAPER.extract_many(context, urls)
+
+
 def _normalize_url(url):
     """
     Variables: